@@ -1,15 +1,15 @@
 import time
 import vtk
+import os
 import math
+import hashlib
+import zlib
+import functools
 import numpy as np
 import pyvista as pv
 from pyvista import examples
-import random
 import logging
-from scipy.ndimage import gaussian_filter
-from scipy.optimize import newton
 from datetime import datetime, timezone, timedelta
-from scipy.spatial.transform import Rotation as R
 
 
 pv.global_theme.show_scalar_bar = False
@@ -27,8 +27,28 @@ pv.global_theme.allow_empty_mesh = True
 logging.basicConfig(level=logging.ERROR)
 import warnings
 warnings.filterwarnings("ignore", message=".*pickpoint.*")
-random.seed(42)
+RNG = np.random.default_rng(42)  # shared seeded generator for procedural scatter
+
+
+@functools.lru_cache(maxsize=None)
+def name_seed(name):
+    """Stable per-name RNG seed (crc32); hash() is salted per process, so textures changed every run."""
+    return zlib.crc32(name.encode())
+
+
+_MOON_SEED_ROOT = np.random.SeedSequence(0xC0FFEE)
+
+
+def moon_rng(name):
+    """Independent substream of one root seed per moon (SeedSequence.spawn, keyed by the
+    name's crc32 rather than spawn order, so a moon's stream doesn't depend on the others)."""
+    seq = np.random.SeedSequence(_MOON_SEED_ROOT.entropy, spawn_key=(name_seed(name),))
+    return np.random.Generator(np.random.PCG64(seq))
+
+
 pl = pv.Plotter(window_size=[1920, 1080])
+# Hold off renders while several hundred actors are added; released right before show().
+pl.suppress_rendering = True
 pv.global_theme.show_scalar_bar = False
 pv.global_theme.title = ""                  
 pv.global_theme.axes.show = False
@@ -48,6 +68,8 @@ KM_TO_SCENE = 1.0 / DISTANCE_KM_PER_UNIT
 SIZEKM_TO_SCENE = 1.0 / SIZE_KM_PER_UNIT
 J2000 = 2451545.0
 MIN_ZOOM_DISTANCE = 5
+# Moving bodies shift the scene bounds slowly; re-fit the clipping planes this often (real time)
+CLIP_RANGE_INTERVAL_NS = 250_000_000
 
 # Moon counts
 TOTAL_MOONS = 95  # Jupiter
@@ -126,6 +148,24 @@ HAUMEA_ORBIT_RADIUS = HAUMEA_AU * AU_SCALE
 MAKEMAKE_ORBIT_RADIUS = MAKEMAKE_AU * AU_SCALE
 CERES_ORBIT_RADIUS = CERES_AU * AU_SCALE
 
+# Scene radii / orbit radii by body name, folded once (lookups no longer rebuild dicts)
+RADII = {
+    "sun": SUN_RADIUS, "mercury": MERCURY_RADIUS, "venus": VENUS_RADIUS,
+    "earth": EARTH_RADIUS, "mars": MARS_RADIUS, "jupiter": JUPITER_RADIUS,
+    "saturn": SATURN_RADIUS, "uranus": URANUS_RADIUS, "neptune": NEPTUNE_RADIUS,
+    "pluto": PLUTO_RADIUS, "eris": ERIS_RADIUS, "haumea": HAUMEA_RADIUS,
+    "makemake": MAKEMAKE_RADIUS, "ceres": CERES_RADIUS,
+}
+ORBIT_RADII = {
+    "mercury": MERCURY_ORBIT_RADIUS, "venus": VENUS_ORBIT_RADIUS,
+    "earth": EARTH_ORBIT_RADIUS, "mars": MARS_ORBIT_RADIUS,
+    "jupiter": JUPITER_ORBIT_RADIUS, "saturn": SATURN_ORBIT_RADIUS,
+    "uranus": URANUS_ORBIT_RADIUS, "neptune": NEPTUNE_ORBIT_RADIUS,
+    "pluto": PLUTO_ORBIT_RADIUS, "eris": ERIS_ORBIT_RADIUS,
+    "haumea": HAUMEA_ORBIT_RADIUS, "makemake": MAKEMAKE_ORBIT_RADIUS,
+    "ceres": CERES_ORBIT_RADIUS,
+}
+
 
 # Gravitational parameters (km^3/s^2)
 GM_SUN = 1.327e11
@@ -158,6 +198,14 @@ GM_PLANET = {
     "ceres": GM_CERES,
 }
 
+# Integer body ids for per-frame lookups (arrays indexed by id instead of string-keyed dicts)
+BODY_NAMES = ["sun", "mercury", "venus", "earth", "mars", "jupiter", "saturn", "uranus",
+              "neptune", "pluto", "eris", "haumea", "makemake", "ceres"]
+BODY_ID = {name: i for i, name in enumerate(BODY_NAMES)}
+GM_ARR = np.array([GM_PLANET.get(name, gm) for name, gm in zip(
+    BODY_NAMES, [GM_SUN, GM_MERCURY, GM_VENUS, GM_EARTH, GM_MARS, GM_JUPITER, GM_SATURN,
+                 GM_URANUS, GM_NEPTUNE, GM_PLUTO, GM_ERIS, GM_HAUMEA, GM_MAKEMAKE, GM_CERES])])
+
 
 
 FPS = 60
@@ -192,6 +240,7 @@ ROTATION_PERIOD = {
 }
 # Convert to **degrees per simulated second**
 ROTATION_DEG_PER_SIMSEC = {k: 360.0 / p if p != 0 else 0 for k, p in ROTATION_PERIOD.items()}
+SPIN_DEG_PER_SIMSEC_ARR = np.array([ROTATION_DEG_PER_SIMSEC[name] for name in BODY_NAMES])
 
 # ---------------------------- AXIAL TILTS (real-world, degrees from NASA/JPL) ----------------------------
 AXIAL_TILTS = {
@@ -221,7 +270,8 @@ AXIAL_TILTS = {
     "callisto": 0.0,
     # Add others as 0° (simplification for irregulars)
 }
-
+# Moons whose tilt is applied in the planets' prograde sense (RotateX by -tilt)
+PROGRADE_MOONS = frozenset(("moon", "io", "europa", "ganymede", "callisto", "phobos", "deimos"))
 
 SECONDS_PER_FRAME = SIM_SECONDS_PER_REAL_SECOND / FPS
 
@@ -244,11 +294,20 @@ EARTH_TINY_THRESHOLD = EARTH_RADIUS * 0.01
 VENUS_TINY_THRESHOLD = VENUS_RADIUS * 0.01
 
 TINY_MOON_SPIN_SCALE_MATCH = True
+# Moons whose radius/camera-distance is below this (under ~1 px) bank their spin instead of
+# rotating every frame; the banked angle is applied once they are close enough to see it
+MOON_SPIN_CULL_RATIO = 1e-3
 
+@functools.lru_cache(maxsize=None)
 def hex_to_rgb(hex_str):
-    """Convert hex color string to RGB tuple (floats 0-1)."""
+    """Convert hex color string to RGB tuple (floats 0-1). Cached; the tuple is immutable."""
     hex_str = hex_str.lstrip('#')
-    return [int(hex_str[i:i+2], 16) / 255.0 for i in (0, 2, 4)]
+    return tuple(int(hex_str[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+
+def hex_to_rgb_bulk(hex_list):
+    """Convert a sequence of '#rrggbb' strings to an (N, 3) float array in one pass."""
+    raw = bytes.fromhex(''.join(h.lstrip('#') for h in hex_list))
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3) / 255.0
 
 SUBLIMATION_DISTANCE = 3 * AU_KM
 # Comet data (real JPL Horizons osculating elements for Nov 11, 2025 epoch JD 2460990.5; a in km)
@@ -1508,36 +1567,39 @@ planet_names = ["mercury", "venus", "earth", "mars", "jupiter", "saturn", "uranu
 
 def get_object_min_dist(actor_name, radius_scene=0):
     """
-    Compute min zoom dist based on actor name and size.
-    For moons: Use radius_km from data if available.
+    Min zoom dist for an actor name. Known bodies/moons come from _MIN_DIST_BY_ACTOR
+    (built at import); an explicit radius_scene or an unseen name is computed directly.
     """
     if not isinstance(actor_name, str):
         actor_name = str(getattr(actor_name, 'name', 'default'))
-    
+    key = actor_name.lower()
+    if radius_scene == 0:
+        dist = _MIN_DIST_BY_ACTOR.get(key)
+        if dist is not None:
+            return dist
+    return _compute_object_min_dist(key, radius_scene)
+
+
+def _compute_object_min_dist(actor_name, radius_scene=0):
+    """
+    Compute min zoom dist based on actor name and size.
+    For moons: Use radius_km from data if available.
+    """
     # Extract base name (e.g., "jupiter_io" -> "jupiter", moon="io")
-    parts = actor_name.lower().split('_')
+    parts = actor_name.split('_')
     base = parts[0] if parts else "default"
     is_moon = len(parts) > 1 and base in planet_names
     
     if not is_moon:
         # Planet/Sun: multiplier * radius
-        radius = {
-            "mercury": MERCURY_RADIUS, "venus": VENUS_RADIUS, "earth": EARTH_RADIUS,
-            "mars": MARS_RADIUS, "jupiter": JUPITER_RADIUS, "saturn": SATURN_RADIUS,
-            "uranus": URANUS_RADIUS, "neptune": NEPTUNE_RADIUS, "sun": SUN_RADIUS
-        }.get(base, 1.0)
+        radius = RADII.get(base, 1.0)
         return OBJECT_MIN_ZOOM_MULTIPLIER.get(base, 5.0) * radius
     
     # Moon: dynamic based on size category
     moon_name = '_'.join(parts[1:])  # Full moon name
-    # Find radius_km from MOON_SCALE_FACTORS (search all planets)
-    radius_km = 1.0  # Default tiny
-    for p_moons in MOON_SCALE_FACTORS.values():
-        for m_data in p_moons:
-            if m_data["name"].lower() == moon_name.lower():
-                radius_km = m_data["radius_km"]
-                break
-        if radius_km > 1.0: break
+    # radius_km from the quantized orbit-table column
+    row = MOON_ROW_BY_NAME.get(moon_name.replace('_', ' '))  # actor names use '_' for spaces
+    radius_km = float(ORBIT_RADIUS_Q[row]) * RADIUS_Q_KM if row is not None else 1.0  # Default tiny
     
     radius_scene = radius_km * SIZEKM_TO_SCENE if radius_scene == 0 else radius_scene
     if radius_km > 100:  # Large (e.g., Ganymede=2631 km)
@@ -1651,18 +1713,15 @@ moon_colors = {
     "Neso": "#CCCCCC"  # Light gray, small irregular moon
 }
 
+# Parsed once into float32 SoA (names + (N,3) RGB); the dict maps names to row views of the array.
+# procedural_moon_actor looks colours up here instead of re-parsing hex.
+MOON_COLOR_NAMES = list(moon_colors)
+MOON_COLOR_ARR = hex_to_rgb_bulk(list(moon_colors.values())).astype(np.float32)
+MOON_COLORS_RGB = dict(zip(MOON_COLOR_NAMES, MOON_COLOR_ARR))
+
 if "MOON_SCALE_FACTORS" not in globals():
     raise ValueError("MOON_SCALE_FACTORS not found — please paste it above this line.")
 
-def solve_kepler(M, e, tol=1e-10):
-    E = M
-    while True:
-        dE = (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
-        E -= dE
-        if abs(dE) < tol:
-            break
-    return E
-
 def angular_speed_rad_per_frame_from_km(gm_km3_s2, r_km):
     # physical orbital angular speed (rad/s) for circular orbit: omega = sqrt(GM / r^3)
     omega_phys = np.sqrt(gm_km3_s2 / (r_km ** 3))
@@ -1677,73 +1736,34 @@ def calculate_keplerian_speed(moon_radius_km, gm):
     r_km = moon_radius_km  # Use real-world km directly
     omega = np.sqrt(gm / (r_km ** 3)) * SPEED_SCALE / FPS
     return omega
-def create_moon_sphere(actor_radius, name="moon"):
-    """
-    Creates a realistic, physically solid moon with cratered surface texture
-    using procedural 3D noise and lighting.
-    """
 
-    # Create high-resolution sphere (smooth geometry)
-    sphere = pv.Sphere(radius=actor_radius, theta_resolution=96, phi_resolution=96)
 
-    # Ensure points are float for filters (fixes your warning)
+@functools.lru_cache(maxsize=8)
+def _unit_moon_sphere(res):
+    """Unit sphere template (float32 points) plus its lon/lat, shared by every moon at this resolution."""
+    sphere = pv.Sphere(radius=1.0, theta_resolution=res, phi_resolution=res)
     sphere.points = sphere.points.astype(np.float32)
-
-    # Convert Cartesian coordinates to spherical
     x, y, z = sphere.points[:, 0], sphere.points[:, 1], sphere.points[:, 2]
-    r = np.sqrt(x**2 + y**2 + z**2)
     lon = np.arctan2(y, x)
-    lat = np.arcsin(z / r)
-
-    # --- Procedural texture generation (crater + surface roughness) ---
-    noise = (0.3 * np.sin(3 * lon) * np.cos(5 * lat) +
-             0.25 * np.sin(7 * lon + 3 * lat) +
-             0.2 * np.sin(11 * lon - 5 * lat))
-    noise += np.random.normal(0, 0.08, size=noise.shape)
-
-    # Add crater-like depressions
-    crater_mask = (np.sin(10 * lon)**2 + np.cos(15 * lat)**2)
-    crater_depth = 0.15 * crater_mask * np.random.rand(len(lon))
-    heightmap = 1 + 0.3 * noise - 0.1 * crater_depth
-
-    # Perturb geometry to add real bumps
-    sphere.points *= heightmap[:, None].astype(np.float32)
-
-    # Compute color variation (grayscale + subtle tint)
-    base_color = np.array([190, 190, 190]) / 255.0  # silver-gray regolith
-    albedo = np.clip(0.8 + 0.4 * noise, 0, 1)
-    colors = (base_color[None, :] * albedo[:, None])
-    colors = np.clip(colors, 0, 1)
-    colors = (colors * 255).astype(np.uint8)
-    sphere.point_data["colors"] = colors
-
-    # Add the moon actor with proper lighting
-    actor = pl.add_mesh(
-        sphere,
-        scalars="colors",
-        rgb=True,
-        smooth_shading=True,
-        ambient=0.25,
-        diffuse=0.65,
-        specular=0.1,
-        name=name
-    )
-
-    return actor
+    lat = np.arcsin(np.clip(z, -1.0, 1.0))
+    lon.flags.writeable = False
+    lat.flags.writeable = False
+    return sphere, lon, lat
 
 
-def datetime_to_julian_day(dt):
-    # dt must be timezone-aware UTC
-    year = dt.year
-    month = dt.month
-    day = dt.day + (dt.hour + (dt.minute + dt.second / 60.0) / 60.0) / 24.0
+def _jd_core(year, month, day, hour, minute, second):
+    """Meeus Julian Date from calendar fields (pure arithmetic; second may be fractional)."""
+    day = day + (hour + (minute + second / 60.0) / 60.0) / 24.0
     if month <= 2:
         year -= 1
         month += 12
     A = year // 100
     B = 2 - A + (A // 4)
-    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-    return JD
+    return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
+
+def datetime_to_julian_day(dt):
+    # dt must be timezone-aware UTC; fields are read once and handed to the arithmetic core
+    return _jd_core(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second + dt.microsecond * 1e-6)
 
 def gmst_from_jd(jd):
     """
@@ -1763,119 +1783,109 @@ def get_current_jd():
     now = datetime.now(timezone.utc)
     return datetime_to_julian_day(now)
 
-def solve_kepler(M, e, tol=1e-10, max_it=50):
-    # M in radians, returns E in radians
-    if e < 0.8:
-        E = M
-    else:
-        E = math.pi
-    for _ in range(max_it):
-        f = E - e*math.sin(E) - M
-        fprime = 1 - e*math.cos(E)
-        if abs(fprime) < 1e-12:
-            break
-        dE = -f / fprime
-        E += dE
-        if abs(dE) < tol:
-            break
-    return E
-
-def kepler_to_state(a_km, e, i_deg, Omega_deg, omega_deg, M0_deg, epoch_jd, target_jd, mu=GM_SUN):
+def get_current_jd_gmst():
+    """Current UTC JD and its GMST (degrees) in one call; callers orienting Earth need both."""
+    jd = get_current_jd()
+    return jd, gmst_from_jd(jd)
+
+# Frame clock works on integer ns elapsed since SIM_START_UTC; JD is derived from it
+SIM_START_JD = datetime_to_julian_day(SIM_START_UTC)
+
+KEPLER_HYPERBOLIC_STEPS = 6  # from the log starter: |f| < 1e-14 for M in [0, 2pi), 1 < e <= 1000
+
+def barker_tan_half_nu(M):
     """
-    Compute position [km] and velocity vector [km/s] from osculating elements.
-    Handles elliptic (e<1), parabolic (e~1), hyperbolic (e>1, a<0).
-    Returns: x_km, y_km, z_km, vel_km_s (array [vx,vy,vz]), v_deg
+    Closed-form (Cardano) root D = tan(nu/2) of Barker's equation D^3/3 + D = M; scalar or array.
+    D is odd in M, so the cube root is taken of |A| + sqrt(A^2 + 1) (no cancellation for M << 0).
     """
-    delta_t_sec = (target_jd - epoch_jd) * 86400.0
-    a_abs = abs(a_km)
-    if a_abs == 0:
-        return 0, 0, 0, np.array([0,0,0]), 0  # Degenerate fallback
-
-    # Mean motion (rad/sec; positive for all)
+    A = 1.5 * np.abs(M)
+    B = (A + np.sqrt(A * A + 1.0)) ** (1.0 / 3.0)
+    return np.copysign(B - 1.0 / B, M)
+
+def pqw_to_eci_matrices(Omega, inc, omega, dtype=np.float64):
+    """(N,3,3) perifocal -> parent-frame rotations Rz(Omega) Rx(inc) Rz(omega); angles in radians."""
+    cO, sO = np.cos(Omega), np.sin(Omega)
+    ci, si = np.cos(inc), np.sin(inc)
+    cw, sw = np.cos(omega), np.sin(omega)
+    R = np.empty((np.size(Omega), 3, 3), dtype=dtype)
+    R[:, 0, 0] = cO * cw - sO * sw * ci
+    R[:, 0, 1] = -cO * sw - sO * cw * ci
+    R[:, 0, 2] = sO * si
+    R[:, 1, 0] = sO * cw + cO * sw * ci
+    R[:, 1, 1] = -sO * sw + cO * cw * ci
+    R[:, 1, 2] = -cO * si
+    R[:, 2, 0] = sw * si
+    R[:, 2, 1] = cw * si
+    R[:, 2, 2] = ci
+    return R
+
+
+@functools.lru_cache(maxsize=None)
+def _pqw_rotation(Omega_deg, i_deg, omega_deg):
+    """Cached perifocal -> parent-frame rotation for one body's fixed angles (degrees).
+    Returns the first two columns as floats (R11, R12, R21, R22, R31, R32); perifocal z is 0."""
+    R = pqw_to_eci_matrices(math.radians(Omega_deg), math.radians(i_deg), math.radians(omega_deg))[0]
+    return tuple(float(v) for v in R[:, :2].ravel())
+
+
+def kepler_to_state_batch(a_km, e, i_deg, Omega_deg, omega_deg, M0_deg, epoch_jd, target_jd, mu=GM_SUN,
+                          R=None):
+    """
+    Position [km], velocity [km/s] and true anomaly from osculating elements, for elliptic (e<1),
+    parabolic (e~1) and hyperbolic (e>1, a<0) orbits. Every argument may be an (N,) array (or
+    broadcast scalar).
+    R: precomputed (N,3,3) rotations (e.g. ORBIT_R_PQW_TO_ECI[rows]); skips the degree->radian
+       conversion and the six trig calls, and i/Omega/omega may then be None.
+    Returns: pos_km (N,3), vel_km_s (N,3), nu (N,) true anomaly in radians.
+    """
+    a_km, e, M0_deg, epoch_jd, target_jd, mu = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (a_km, e, M0_deg, epoch_jd, target_jd, mu)))
+    a_abs = np.abs(a_km)
     n = np.sqrt(mu / a_abs**3)
-    M0_rad = np.radians(M0_deg)
-    M = (M0_rad + n * delta_t_sec) % (2 * np.pi)  # Always add time; mod 2pi
-
-    # Solve for true anomaly nu (radians)
-    if abs(e - 1) < 1e-6:  # Parabolic approx
-        # Barker's eq: D^3/3 + D - M = 0; solve for D = tan(nu/2)
-        def barker_eq(D): return D**3 / 3 + D - M
-        D = newton(barker_eq, M)  # Robust solver
-        nu = 2 * np.arctan(D)
-    elif e < 1:  # Elliptic
-        def kepler_eq(E): return E - e * np.sin(E) - M
-        E_guess = M if e < 0.8 else np.pi
-        E = newton(kepler_eq, E_guess, tol=1e-12)
-        nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
-    else:  # Hyperbolic
-        def hyp_kepler_eq(F): return e * np.sinh(F) - F - M
-        # Better guess: asymptotic for large |M|
-        F_guess = np.sign(M) * np.log(np.abs(2 * M / e) + 1.8) if np.abs(M) > 1e-6 else M
-        F = newton(hyp_kepler_eq, F_guess, tol=1e-12)
-        nu = 2 * np.arctan(np.sqrt((e + 1) / (e - 1)) * np.tanh(F / 2))
-
-    v_deg = np.degrees(nu)
+    M = np.remainder(np.radians(M0_deg) + n * (target_jd - epoch_jd) * 86400.0, 2 * np.pi)
+
+    par = np.abs(e - 1) < 1e-6
+    ell = (e < 1) & ~par
+    hyp = ~(par | ell)
+    nu = np.empty_like(M)
+    if par.any():  # Barker's equation, closed form
+        nu[par] = 2 * np.arctan(barker_tan_half_nu(M[par]))
+    if ell.any():
+        ee = e[ell]
+        E = solve_kepler_vec(M[ell], ee)
+        nu[ell] = 2 * np.arctan2(np.sqrt(1 + ee) * np.sin(E / 2), np.sqrt(1 - ee) * np.cos(E / 2))
+    if hyp.any():  # Halley on e*sinh(F) - F = M from a log starter
+        ee, Mh = e[hyp], M[hyp]
+        F = np.where(np.abs(Mh) > 1e-6, np.sign(Mh) * np.log(2 * np.abs(Mh) / ee + 1.8), Mh)
+        for _ in range(KEPLER_HYPERBOLIC_STEPS):
+            s = ee * np.sinh(F)
+            f = s - F - Mh
+            fp = ee * np.cosh(F) - 1
+            F -= 2 * f * fp / (2 * fp * fp - f * s)
+        nu[hyp] = 2 * np.arctan(np.sqrt((ee + 1) / (ee - 1)) * np.tanh(F / 2))
+
+    # Perifocal state; semi-latus rectum p = |a| |1 - e^2| covers both conics
     cos_nu, sin_nu = np.cos(nu), np.sin(nu)
-
-    # Radial distance r (km)
-    if e < 1:
-        r = a_abs * (1 - e**2) / (1 + e * cos_nu)
-    else:  # Hyperbolic: a negative, but |a| * (e^2 - 1)
-        r = a_abs * (e**2 - 1) / (1 + e * cos_nu)
-    r = max(r, 1e-6)  # Min r guard
-
-    # Perifocal position/velocity
-    pos_peri = r * np.array([cos_nu, sin_nu, 0.0])
-    v_mag = np.sqrt(mu * (2 / r - 1 / a_km))  # Vis-viva (valid for all conics)
-    vel_peri = v_mag * np.array([-sin_nu, (e + cos_nu) / (1 + e * cos_nu) * (1 + e * cos_nu), 0.0])  # Corrected angular vel
-
-    # ECI transformation (standard rotation)
-    O, inc, w = map(np.radians, [Omega_deg, i_deg, omega_deg])
-    Rz_w = np.array([[np.cos(w), -np.sin(w), 0], [np.sin(w), np.cos(w), 0], [0, 0, 1]])
-    Rx_inc = np.array([[1, 0, 0], [0, np.cos(inc), -np.sin(inc)], [0, np.sin(inc), np.cos(inc)]])
-    Rz_O = np.array([[np.cos(O), -np.sin(O), 0], [np.sin(O), np.cos(O), 0], [0, 0, 1]])
-    R = np.dot(Rz_O, np.dot(Rx_inc, Rz_w))
-    pos_eci = np.dot(R, pos_peri)
-    vel_eci = np.dot(R, vel_peri)
-
-    # Finite guard
-    if not np.all(np.isfinite(pos_eci)) or not np.all(np.isfinite(vel_eci)):
-        pos_eci = np.zeros(3)
-        vel_eci = np.zeros(3)
-
-    return pos_eci[0], pos_eci[1], pos_eci[2], vel_eci, v_deg
-
-
-def solve_kepler_hyperbolic(M, e, tol=1e-12, max_it=100):
-    # M in radians, returns H (hyperbolic anomaly) in radians
-    sign_M = 1 if M > 0 else -1
-    H = sign_M * math.log(2 * abs(M) / e + 1.8)  # Initial guess
-    for _ in range(max_it):
-        f = e * math.sinh(H) - H - M
-        fprime = e * math.cosh(H) - 1
-        if abs(fprime) < 1e-12:
-            break
-        dH = -f / fprime
-        H -= dH
-        if abs(dH) < tol:
-            break
-    return H
-
-def set_body_position_from_elements(name, actor, elements, target_jd, mu=GM_SUN):
-    x_km, y_km, z_km, _, _ = kepler_to_state(
-        elements["a_km"],  # <-- Change to this (direct use of "a_km")
-        elements["e"],
-        elements["i_deg"],
-        elements["Omega_deg"],
-        elements["omega_deg"],
-        elements["M0_deg"],
-        elements["epoch_jd"],
-        target_jd,
-        mu=mu
-    )
-    pos_scene = np.array([x_km, y_km, z_km]) * KM_TO_SCENE
-    actor.SetPosition(*pos_scene)
-    
+    p = a_abs * np.abs(1 - e * e)
+    r = np.maximum(p / (1 + e * cos_nu), 1e-6)
+    # p -> 0 as e -> 1 with finite a, so near-parabolic rows (same tolerance as above) get no velocity
+    v_scale = np.sqrt(mu / np.where(par, np.inf, p))
+    pos_peri = np.stack((r * cos_nu, r * sin_nu), axis=1)
+    vel_peri = np.stack((-v_scale * sin_nu, v_scale * (e + cos_nu)), axis=1)
+
+    if R is None:
+        R = pqw_to_eci_matrices(np.radians(Omega_deg), np.radians(i_deg), np.radians(omega_deg))
+    R = np.broadcast_to(R[:, :, :2], (len(M), 3, 2))
+    pos = np.einsum('nij,nj->ni', R, pos_peri)
+    vel = np.einsum('nij,nj->ni', R, vel_peri)
+
+    bad = ~(np.isfinite(pos).all(axis=1) & np.isfinite(vel).all(axis=1))
+    pos[bad] = 0.0
+    vel[bad] = 0.0
+    return pos, vel, nu
+
+
+# Source elements for the heliocentric bodies; frozen into the orbit table (BODY_ORBIT_ROWS) below
 orbital_elements = {
     "mercury": {
         "a_km": 0.38709927 * AU_KM,
@@ -2005,177 +2015,351 @@ orbital_elements = {
     },
 }
 
-def procedural_moon_actor(sphere, base_hex, name, ambient=0.2, diffuse=0.6, specular=0.1, emissive=False):
+# ---------------------------- ORBIT TABLE (SoA) ----------------------------
+# Moons, comets, planets + dwarfs flattened into parallel arrays once at import, so the per-frame
+# propagation is a handful of NumPy ufuncs instead of one Kepler solve per body.
+# ORBIT_NAMES[row] = (parent, name); ORBIT_PARENT_ID[row] = BODY_ID[parent] (comets, planets: "sun").
+KEPLER_HALLEY_STEPS = 1  # after the Markley starter one step gives |f| < 1e-10 for all e<1
+RADIUS_Q_KM = 0.05  # body radii stored as uint16 multiples of this (max ~3276 km)
+
+
+def _build_orbit_table():
+    """Walk MOON_SCALE_FACTORS + COMET_ELEMENTS + orbital_elements once into float64 SoA arrays."""
+    names, parent_id, rows = [], [], []
+    for parent, moons in MOON_SCALE_FACTORS.items():
+        mu = GM_ARR[BODY_ID[parent]]
+        for m in moons:
+            if m.get("a_km", 0) <= 0:
+                continue
+            names.append((parent, m["name"]))
+            parent_id.append(BODY_ID[parent])
+            rows.append((m["a_km"], m["e"], m["i_deg"], m["Omega_deg"],
+                         m["omega_deg"], m["M0_deg"], m["epoch_jd"], mu, m["radius_km"]))
+    for name, c in COMET_ELEMENTS.items():
+        names.append(("sun", name))
+        parent_id.append(BODY_ID["sun"])
+        rows.append((c["a_km"], c["e"], c["i_deg"], c["Omega_deg"],
+                     c["omega_deg"], c["M0_deg"], c["epoch_jd"], GM_SUN, c["radius_km"]))
+    # Heliocentric planets + dwarfs last; their radii live in RADII (Jupiter overflows radius_q)
+    for name in BODY_NAMES[1:]:
+        el = orbital_elements[name]
+        names.append(("sun", name))
+        parent_id.append(BODY_ID["sun"])
+        rows.append((el["a_km"], el["e"], el["i_deg"], el["Omega_deg"],
+                     el["omega_deg"], el["M0_deg"], el["epoch_jd"], GM_SUN, 0.0))
+    # Shape/orientation columns are float32 (scene placement only). The phase
+    # columns (a, M0, epoch, n_mean) stay float64: n*dt reaches ~1e4 rad and the
+    # comet tails difference consecutive frames, which float32 would quantise.
+    tab = np.array(rows, dtype=np.float64)
+    return dict(
+        names=names,
+        parent_id=np.array(parent_id, dtype=np.int32),
+        a=np.ascontiguousarray(tab[:, 0]),
+        e=tab[:, 1].astype(np.float32),
+        i=np.radians(tab[:, 2]).astype(np.float32),
+        Omega=np.radians(tab[:, 3]).astype(np.float32),   # longitude of ascending node
+        omega=np.radians(tab[:, 4]).astype(np.float32),   # argument of periapsis
+        M0=np.radians(tab[:, 5]),
+        epoch_jd=np.ascontiguousarray(tab[:, 6]),
+        n_mean=np.sqrt(tab[:, 7] / np.abs(tab[:, 0])**3),  # mean motion, rad/s
+        b=tab[:, 0] * np.sqrt(1 - tab[:, 1]**2),             # semi-minor axis, km
+        radius_q=np.rint(tab[:, 8] / RADIUS_Q_KM).astype(np.uint16),
+    )
+
+
+_orbit_table = _build_orbit_table()
+ORBIT_NAMES = _orbit_table["names"]
+ORBIT_PARENT_ID = _orbit_table["parent_id"]
+ORBIT_A_KM = _orbit_table["a"]
+ORBIT_E = _orbit_table["e"]
+ORBIT_I = _orbit_table["i"]
+ORBIT_OMEGA = _orbit_table["Omega"]
+ORBIT_OMEGA_P = _orbit_table["omega"]
+ORBIT_M0 = _orbit_table["M0"]
+ORBIT_EPOCH_JD = _orbit_table["epoch_jd"]
+ORBIT_N_MEAN = _orbit_table["n_mean"]
+ORBIT_B_KM = _orbit_table["b"]
+ORBIT_RADIUS_Q = _orbit_table["radius_q"]
+ORBIT_INDEX = {key: row for row, key in enumerate(ORBIT_NAMES)}
+BODY_ORBIT_ROWS = np.array([ORBIT_INDEX[("sun", name)] for name in BODY_NAMES[1:]], dtype=np.intp)  # BODY_ID - 1
+MOON_ROW_BY_NAME = {name.lower(): row for row, (parent, name) in enumerate(ORBIT_NAMES) if parent != "sun"}
+
+# Min zoom distance for every known actor name (bodies + "{planet}_{moon}"), resolved once
+_MIN_DIST_BY_ACTOR = {name: _compute_object_min_dist(name) for name in ["sun"] + planet_names}
+_MIN_DIST_BY_ACTOR.update({
+    key: _compute_object_min_dist(key)
+    for key in (f"{parent}_{name.lower().replace(' ', '_')}" for parent, name in ORBIT_NAMES if parent != "sun")
+})
+
+# Epochs as seconds past J2000; only a handful of distinct epochs exist, so convert each once.
+_epochs, _epoch_inv = np.unique(ORBIT_EPOCH_JD, return_inverse=True)
+ORBIT_EPOCH_SEC = ((_epochs - J2000) * 86400.0)[_epoch_inv]
+del _epochs, _epoch_inv
+
+# Per-planet SoA slices of the orbit table (each planet's moons occupy contiguous rows).
+# The orbit columns are views; name and radius_km are copies, so writes to them do not reach the table.
+MOONS = {}
+for _row, (_parent, _name) in enumerate(ORBIT_NAMES):
+    if _parent != "sun":
+        MOONS.setdefault(_parent, []).append(_row)
+for _parent, _rows in MOONS.items():
+    _sl = slice(_rows[0], _rows[-1] + 1)
+    MOONS[_parent] = dict(
+        rows=_sl,
+        name=np.array([ORBIT_NAMES[r][1] for r in _rows]),
+        a_km=ORBIT_A_KM[_sl], e=ORBIT_E[_sl], i=ORBIT_I[_sl],
+        Omega=ORBIT_OMEGA[_sl], omega=ORBIT_OMEGA_P[_sl], M0=ORBIT_M0[_sl],
+        epoch_jd=ORBIT_EPOCH_JD[_sl], n_mean=ORBIT_N_MEAN[_sl],
+        radius_km=ORBIT_RADIUS_Q[_sl] * RADIUS_Q_KM,
+    )
+del _row, _parent, _name, _rows, _sl
+
+# Perifocal -> parent-frame rotation Rz(Omega) Rx(i) Rz(omega), fixed per body.
+# float32 is plenty for scene placement and halves the per-frame traffic.
+ORBIT_R_PQW_TO_ECI = pqw_to_eci_matrices(ORBIT_OMEGA, ORBIT_I, ORBIT_OMEGA_P, dtype=np.float32)
+
+
+def solve_kepler_vec(M, e, n_iter=KEPLER_HALLEY_STEPS):
+    """Vectorized E - e*sin(E) = M (elliptic): Markley (1995) starter + Halley steps."""
+    M_red = np.remainder(M + np.pi, 2 * np.pi) - np.pi  # starter wants [-pi, pi]
+    alpha = (3 * np.pi**2 + 1.6 * np.pi * (np.pi - np.abs(M_red)) / (1 + e)) / (np.pi**2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - M_red * M_red
+    r = 3 * alpha * d * (d - 1 + e) * M_red + M_red**3
+    w = (np.abs(r) + np.sqrt(q**3 + r * r)) ** (2.0 / 3.0)
+    E = (2 * r * w / (w * w + w * q + q * q) + M_red) / d
+    for _ in range(n_iter):
+        s = e * np.sin(E)
+        f = E - s - M_red
+        fp = 1.0 - e * np.cos(E)
+        E -= 2 * f * fp / (2 * fp * fp - f * s)
+    return E + (M - M_red)
+
+
+def propagate_orbit_table(rows, target_jd, time_scale=1.0, with_nu=False, out=None, R=None):
+    """
+    Batched Kepler propagation for ORBIT_* rows (elliptic orbits).
+    time_scale stretches elapsed time per row (moon visual slow-down).
+    R: optional ORBIT_R_PQW_TO_ECI[rows, :, :2], gathered once by callers with a fixed row set.
+    Returns: pos_km (N,3) relative to the parent (written into out if given),
+             nu (N,) true anomaly in radians, or None unless with_nu.
+    """
+    # Mean anomaly, reduced in place
+    M = (target_jd - J2000) * 86400.0 - ORBIT_EPOCH_SEC[rows]
+    M *= time_scale
+    M *= ORBIT_N_MEAN[rows]
+    M += ORBIT_M0[rows]
+    np.remainder(M, 2 * np.pi, out=M)
+    e = ORBIT_E[rows]
+    E = solve_kepler_vec(M, e)
+
+    # Perifocal position straight from E: (a(cosE - e), b sinE); no true anomaly needed
+    cosE, sinE = np.cos(E), np.sin(E)
+    xy = np.empty((len(E), 2))
+    np.subtract(cosE, e, out=xy[:, 0])
+    xy[:, 0] *= ORBIT_A_KM[rows]
+    np.multiply(sinE, ORBIT_B_KM[rows], out=xy[:, 1])
+    if R is None:
+        R = ORBIT_R_PQW_TO_ECI[rows, :, :2]
+    pos = np.einsum('nij,nj->ni', R, xy, out=out)
+
+    nu = None
+    if with_nu:
+        nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    return pos, nu
+
+
+def _base_moon_noise(lon, lat):
+    """0.35 sin(3lon)cos(5lat) + 0.25 sin(7lon+3lat) + 0.15 sin(11lon-5lat), accumulated in place
+    (two buffers, dtype of lon/lat)."""
+    noise = np.sin(3 * lon)
+    noise *= np.cos(5 * lat)
+    noise *= 0.35
+    t = 7 * lon
+    t += 3 * lat
+    np.sin(t, out=t)
+    t *= 0.25
+    noise += t
+    np.multiply(lon, 11, out=t)
+    t -= 5 * lat
+    np.sin(t, out=t)
+    t *= 0.15
+    noise += t
+    return noise
+
+
+@functools.lru_cache(maxsize=8)
+def _moon_harmonics(res):
+    """lon/lat and the base surface noise of a res x res moon sphere; float32, shared by every moon."""
+    _, lon, lat = _unit_moon_sphere(res)
+    base = _base_moon_noise(lon, lat)
+    base.flags.writeable = False
+    return lon, lat, base
+
+
+# Surface profile per moon family, in match order: the first token found in the lower-cased
+# moon name wins (so "titania" takes the "titan" profile, as the old if/elif chain did).
+# token -> (base_rgb or None to keep the moon's colour, A, B, harmonic, C, specular override);
+# albedo *= A + B*harmonic + C*noise, with ("sum", k, m) = sin(k lon + m lat) and
+# ("prod", k, m) = sin(k lon) cos(m lat). Triton has its own code path (None).
+_MOON_PROFILE_ROWS = [
+    ("io",        (0.93, 0.74, 0.24), 0.9,  0.2,  ("sum", 6, 3),   0.0, None),
+    ("europa",    (0.88, 0.93, 1.0),  0.85, 0.3,  ("prod", 8, 4),  0.0, None),
+    ("ganymede",  (0.72, 0.72, 0.72), 0.8,  0.2,  ("sum", 5, -2),  0.0, None),
+    ("callisto",  (0.55, 0.47, 0.41), 0.75, 0.25, ("sum", 4, 3),   0.0, None),
+    ("triton",    None),
+    ("luna",      (0.75, 0.75, 0.75), 0.8,  0.2,  ("prod", 5, 3),  0.0, None),  # Earth's Moon
+    ("moon",      (0.75, 0.75, 0.75), 0.8,  0.2,  ("prod", 5, 3),  0.0, None),
+    ("titan",     (0.95, 0.75, 0.45), 0.7,  0.3,  ("prod", 4, 6),  0.0, None),  # hazy orange
+    ("enceladus", (0.95, 0.95, 1.0),  0.9,  0.1,  ("sum", 10, 5),  0.0, None),  # tiger stripes
+    ("iapetus",   None,               0.7,  0.3,  ("sum", 4, 2),   0.0, 0.05),  # two-toned, see below
+    ("rhea",      (0.7, 0.7, 0.75),   0.85, 0.15, ("prod", 6, 3),  0.0, None),
+    ("dione",     (0.75, 0.75, 0.8),  0.8,  0.2,  ("sum", 7, -4),  0.0, None),
+    ("mimas",     (0.85, 0.85, 0.9),  0.9,  0.05, ("prod", 2, 1),  0.2, None),  # Herschel crater
+    ("phobos",    (0.65, 0.2, 0.05),  0.6,  0.4,  ("sum", 4, 1),   0.0, None),
+    ("deimos",    (0.5, 0.5, 0.5),    0.7,  0.3,  ("sum", 5, -2),  0.0, None),
+    ("miranda",   (0.8, 0.8, 0.85),   0.75, 0.1,  ("prod", 10, 6), 0.2, None),  # chaotic terrain
+    ("titania",   (0.75, 0.75, 0.8),  0.8,  0.2,  ("prod", 5, 4),  0.0, None),
+    ("oberon",    (0.75, 0.75, 0.8),  0.8,  0.2,  ("prod", 5, 4),  0.0, None),
+    ("proteus",   (0.5, 0.5, 0.55),   0.65, 0.35, ("sum", 3, 2),   0.0, None),
+    ("charon",    (0.65, 0.65, 0.7),  0.75, 0.25, ("prod", 6, 3),  0.0, None),
+    ("styx",      (0.4, 0.4, 0.45),   0.6,  0.4,  ("sum", 4, 1),   0.0, None),
+    ("nix",       (0.55, 0.55, 0.6),  0.7,  0.3,  ("sum", 5, -2),  0.0, None),
+    ("kerberos",  (0.45, 0.45, 0.5),  0.65, 0.35, ("sum", 3, 2),   0.0, None),
+    ("hydra",     (0.6, 0.6, 0.65),   0.75, 0.25, ("prod", 7, 4),  0.0, None),
+    ("/",         None,               0.8,  0.0,  None,            0.2, 0.05),  # provisional: matte, minimal
+]
+MOON_PROFILES = {}
+for _token, _rgb, *_rest in _MOON_PROFILE_ROWS:
+    MOON_PROFILES[_token] = (None if _rgb is None else np.array(_rgb, dtype=np.float32), *_rest) if _rest else None
+_IAPETUS_DARK_RGB = np.full(3, 0.3, dtype=np.float32)
+_IAPETUS_BRIGHT_RGB = np.full(3, 0.9, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def _moon_profile_key(lname):
+    """First MOON_PROFILES token contained in a lower-cased moon name, or None."""
+    return next((token for token in MOON_PROFILES if token in lname), None)
+
+
+def _moon_harmonic(lon, lat, kind, k, m):
+    if kind == "sum":
+        return np.sin(k * lon + m * lat)
+    return np.sin(k * lon) * np.cos(m * lat)
+
+
+# (name or shared bucket, base colour, res, ambient, diffuse, specular)
+#   -> (read-only uint8 colours, ambient, diffuse, specular)
+_MOON_SURFACE_CACHE = {}
+
+
+def procedural_moon_actor(sphere, base_hex, name, ambient=0.2, diffuse=0.6, specular=0.1, emissive=False, res=None):
+    """res: the sphere's theta/phi resolution; when given, lon/lat + noise come from the shared
+    template and the finished colours are memoized and shared (by reference) between meshes.
+    Provisional designations ("S/2004 S 7") all get the same generic surface per colour."""
+    bucket = "s/generic" if "/" in name else name
+    colour = tuple(MOON_COLORS_RGB[name].tolist()) if name in MOON_COLORS_RGB else base_hex
+    key = (bucket, colour, res, ambient, diffuse, specular)
+    surface = _MOON_SURFACE_CACHE.get(key) if res is not None else None
+    if surface is None:
+        surface = _procedural_moon_surface(sphere, base_hex, name, ambient, diffuse, specular, res, seed_name=bucket)
+        if res is not None:
+            _MOON_SURFACE_CACHE[key] = surface
+    colors, ambient, diffuse, specular = surface
+    sphere.point_data["colors"] = colors  # read-only; VTK wraps it without a copy
+    moon_actor = pl.add_mesh(
+        sphere, scalars="colors", rgb=True, smooth_shading=True,
+        ambient=ambient, diffuse=diffuse, specular=specular, specular_power=10, name=name, render=False, remove_existing_actor=False, lighting=True
+    )
+    if emissive:
+        prop = moon_actor.GetProperty()
+        prop.SetAmbient(min(1.0, ambient + 0.15))
+        prop.SetDiffuse(diffuse * 0.9)
+    return moon_actor
+
+
+def _procedural_moon_surface(sphere, base_hex, name, ambient, diffuse, specular, res=None, seed_name=None):
     # Use predefined color if available for the moon name
-    if name in moon_colors:
-        base_hex = moon_colors[name]
-   
-    if not (isinstance(base_hex, str) and base_hex.startswith("#") and len(base_hex) == 7):
-        base_hex = "#cccccc"
-    try:
-        base_rgb = np.array([int(base_hex[i:i+2], 16) for i in (1, 3, 5)]) / 255.0
-    except Exception:
-        base_rgb = np.array([0.8, 0.8, 0.8])
-    pts = sphere.points.copy()
-    norms = np.linalg.norm(pts, axis=1, keepdims=True) + 1e-9
-    x, y, z = pts[:, 0]/norms[:, 0], pts[:, 1]/norms[:, 0], pts[:, 2]/norms[:, 0]
-    lon = np.arctan2(y, x)
-    lat = np.arcsin(z)
-    noise = (0.35*np.sin(3*lon)*np.cos(5*lat) +
-             0.25*np.sin(7*lon + 3*lat) +
-             0.15*np.sin(11*lon - 5*lat))
-    rng = np.random.default_rng(abs(hash(name)) % (2**32))
-    noise += rng.normal(0, 0.05, size=noise.shape)
+    if name in MOON_COLORS_RGB:
+        base_rgb = MOON_COLORS_RGB[name]
+    else:
+        if not (isinstance(base_hex, str) and base_hex.startswith("#") and len(base_hex) == 7):
+            base_hex = "#cccccc"
+        try:
+            base_rgb = np.array(hex_to_rgb(base_hex), dtype=np.float32)
+        except Exception:
+            base_rgb = np.array([0.8, 0.8, 0.8], dtype=np.float32)
+    # Per-vertex work stays float32 (the point dtype); only the final (N,3) colour mix widens
+    if res is not None:
+        lon, lat, noise = _moon_harmonics(res)
+        noise = noise.copy()
+    else:
+        pts = sphere.points.astype(np.float32)
+        norms = np.linalg.norm(pts, axis=1, keepdims=True) + np.float32(1e-9)
+        x, y, z = pts[:, 0]/norms[:, 0], pts[:, 1]/norms[:, 0], pts[:, 2]/norms[:, 0]
+        lon = np.arctan2(y, x)
+        lat = np.arcsin(np.clip(z, -1, 1))
+        noise = _base_moon_noise(lon, lat)
+    grain = moon_rng(seed_name or name).standard_normal(noise.shape, dtype=np.float32)
+    grain *= 0.05
+    noise += grain
     noise = (noise - noise.min()) / (noise.max() - noise.min() + 1e-9)
     albedo = 0.7 + 0.3 * noise
-    lname = name.lower()
-    # Initialize final_rgb with default value
-    final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    if "io" in lname:
-        base_rgb = np.array([0.93, 0.74, 0.24])
-        albedo *= 0.9 + 0.2*np.sin(6*lon + 3*lat)
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "europa" in lname:
-        base_rgb = np.array([0.88, 0.93, 1.0])
-        albedo *= 0.85 + 0.3*np.sin(8*lon)*np.cos(4*lat)
+    profile_key = _moon_profile_key(name.lower())
+    if profile_key is None:
         final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "ganymede" in lname:
-        base_rgb = np.array([0.72, 0.72, 0.72])
-        albedo *= 0.8 + 0.2*np.sin(5*lon - 2*lat)
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "callisto" in lname:
-        base_rgb = np.array([0.55, 0.47, 0.41])
-        albedo *= 0.75 + 0.25*np.sin(4*lon + 3*lat)
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "triton" in lname:
-        base_rgb = np.array([0.95, 0.90, 0.93])
-        tint_dark = np.array([0.55, 0.45, 0.50])
+    elif profile_key == "triton":
+        base_rgb = np.array([0.95, 0.90, 0.93], dtype=np.float32)
+        tint_dark = np.array([0.55, 0.45, 0.50], dtype=np.float32)
         noise_main = (0.35*np.sin(5*lon + 2*lat) +
                       0.25*np.sin(9*lat - 3*lon) +
                       0.15*np.sin(12*lon + 7*lat))
         geyser = np.sin(10*lon) * np.cos(4*lat)
-        dark_mask = (geyser > 0.85).astype(float)
+        dark_mask = (geyser > 0.85).astype(np.float32)
         noise_main = (noise_main - noise_main.min()) / (noise_main.max() - noise_main.min() + 1e-9)
         color_mix = base_rgb * (0.85 + 0.15 * noise_main[:, None])
         color_mix = np.where(dark_mask[:, None] > 0.5, tint_dark, color_mix)
         color_mix *= (0.85 + 0.15 * np.cos(lat)[:, None])
         ambient, diffuse, specular = 0.30, 0.30, 0.00
         final_rgb = np.clip(color_mix, 0, 1)
-    elif "luna" in lname or "moon" in lname: # Earth's Moon
-        base_rgb = np.array([0.75, 0.75, 0.75]) # Grayish for Luna
-        albedo *= 0.8 + 0.2*np.sin(5*lon)*np.cos(3*lat) # Crater-like texture
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    # Add customs for Saturn moons if desired (e.g., Titan hazy orange)
-    elif "titan" in lname:
-        base_rgb = np.array([0.95, 0.75, 0.45]) # Orangish for hazy atmosphere
-        albedo *= 0.7 + 0.3*np.sin(4*lon)*np.cos(6*lat) # Surface features
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "enceladus" in lname:
-        base_rgb = np.array([0.95, 0.95, 1.0]) # Icy white
-        albedo *= 0.9 + 0.1*np.sin(10*lon + 5*lat) # Tiger stripes
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "iapetus" in lname:
-        # Two-toned: dark leading hemisphere, bright trailing
-        dark_rgb = np.array([0.3, 0.3, 0.3]) # Dark side
-        bright_rgb = np.array([0.9, 0.9, 0.9]) # Bright side
-        # Mask for leading hemisphere (dark)
-        dark_mask = np.cos(lon) > 0 # Approximate leading side
-        albedo *= 0.7 + 0.3 * np.sin(4*lon + 2*lat) # Cratered texture
-        final_rgb = np.where(dark_mask[:, None], dark_rgb * albedo[:, None], bright_rgb * albedo[:, None])
-        final_rgb = np.clip(final_rgb, 0, 1)
-        specular = 0.05 # Low specular for rough surface
-    elif "rhea" in lname:
-        base_rgb = np.array([0.7, 0.7, 0.75]) # Grayish icy
-        albedo *= 0.85 + 0.15 * np.sin(6*lon) * np.cos(3*lat) # Craters and rays
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "dione" in lname:
-        base_rgb = np.array([0.75, 0.75, 0.8]) # Silvery icy
-        albedo *= 0.8 + 0.2 * np.sin(7*lon - 4*lat) # Wispy terrain approximation
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "mimas" in lname:
-        base_rgb = np.array([0.85, 0.85, 0.9]) # Icy white
-        # Approximate Herschel crater with a large low-frequency feature
-        crater = 0.5 * np.sin(2*lon) * np.cos(lat) # Simple polar crater sim
-        albedo *= 0.9 + 0.1 * crater + 0.2 * noise
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "phobos" in lname:
-        base_rgb = np.array([0.65, 0.2, 0.05]) # Reddish
-        albedo *= 0.6 + 0.4 * np.sin(4*lon + lat) # Cratered, irregular
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "deimos" in lname:
-        base_rgb = np.array([0.5, 0.5, 0.5]) # Gray
-        albedo *= 0.7 + 0.3 * np.sin(5*lon - 2*lat) # Dusty craters
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "miranda" in lname:
-        base_rgb = np.array([0.8, 0.8, 0.85]) # Light gray icy
-        # Chaotic terrain: high-frequency noise
-        chaos_noise = 0.4 * np.sin(10*lon) * np.cos(6*lat)
-        albedo *= 0.75 + 0.25 * chaos_noise + 0.2 * noise
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "titania" in lname or "oberon" in lname:
-        base_rgb = np.array([0.75, 0.75, 0.8]) # Silvery gray
-        albedo *= 0.8 + 0.2 * np.sin(5*lon) * np.cos(4*lat) # Cratered icy
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "proteus" in lname:
-        base_rgb = np.array([0.5, 0.5, 0.55]) # Dark gray rocky
-        albedo *= 0.65 + 0.35 * np.sin(3*lon + 2*lat) # Irregular craters
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    # Pluto moons
-    elif "charon" in lname:
-        base_rgb = np.array([0.65, 0.65, 0.7])  # Grayish-red icy
-        albedo *= 0.75 + 0.25 * np.sin(6*lon) * np.cos(3*lat)  # Craters, reddish tint
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "styx" in lname:
-        base_rgb = np.array([0.4, 0.4, 0.45])  # Dark gray rocky
-        albedo *= 0.6 + 0.4 * np.sin(4*lon + lat)  # Cratered irregular
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "nix" in lname:
-        base_rgb = np.array([0.55, 0.55, 0.6])  # Medium gray icy
-        albedo *= 0.7 + 0.3 * np.sin(5*lon - 2*lat)  # Dusty surface
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "kerberos" in lname:
-        base_rgb = np.array([0.45, 0.45, 0.5])  # Dark gray
-        albedo *= 0.65 + 0.35 * np.sin(3*lon + 2*lat)  # Rough craters
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    elif "hydra" in lname:
-        base_rgb = np.array([0.6, 0.6, 0.65])  # Light gray icy
-        albedo *= 0.75 + 0.25 * np.sin(7*lon) * np.cos(4*lat)  # Elongated craters
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-    # For small/provisional moons, use default procedural noise with low variation
-    elif any(s in lname for s in ["/", "s/"]):
-        albedo *= 0.8 + 0.2 * noise # Minimal texture
-        final_rgb = np.clip(base_rgb * albedo[:, None], 0, 1)
-        specular = 0.05 # Matte
-    # Add more for other major moons like Rhea, Iapetus if needed
-    sphere.point_data["colors"] = (final_rgb * 255).astype(np.uint8)
-    moon_actor = pl.add_mesh(
-        sphere, scalars="colors", rgb=True, smooth_shading=True,
-        ambient=ambient, diffuse=diffuse, specular=specular, specular_power=10, name=name, lighting=True
-    )
-    if emissive:
-        prop = moon_actor.GetProperty()
-        prop.SetAmbient(min(1.0, ambient + 0.15))
-        prop.SetDiffuse(diffuse * 0.9)
-    return moon_actor
+    else:
+        rgb, a, b, harmonic, c, spec = MOON_PROFILES[profile_key]
+        factor = _moon_harmonic(lon, lat, *harmonic) if b else np.zeros_like(albedo)
+        factor *= b
+        factor += a
+        if c:
+            factor += c * noise
+        albedo *= factor
+        if profile_key == "iapetus":
+            # Two-toned: dark leading hemisphere (cos lon > 0), bright trailing
+            final_rgb = np.where((np.cos(lon) > 0)[:, None], _IAPETUS_DARK_RGB * albedo[:, None],
+                                 _IAPETUS_BRIGHT_RGB * albedo[:, None])
+            final_rgb = np.clip(final_rgb, 0, 1)
+        else:
+            final_rgb = np.clip((base_rgb if rgb is None else rgb) * albedo[:, None], 0, 1)
+        if spec is not None:
+            specular = spec
+    # Whole colour pass is float32; scale in place and cast once (no float64 temporary)
+    final_rgb = np.asarray(final_rgb, dtype=np.float32)
+    final_rgb *= 255
+    colors = final_rgb.astype(np.uint8)
+    colors.flags.writeable = False
+    return colors, ambient, diffuse, specular
 
 def generate_moons(planet_name):
     moons = []
-    raw_moons = MOON_SCALE_FACTORS.get(planet_name, [])
-    mu = GM_PLANET.get(planet_name, GM_EARTH)  # km³/s²
-
-    for moon in raw_moons:
-        a = moon.get("a_km", 0)
-        if a <= 0:
-            continue
-
-        # Mean motion n = sqrt(μ / a³) in rad/s
-        n = math.sqrt(mu / (a ** 3))
-        M0_rad = math.radians(moon.get("M0_deg", 0))
-
+    soa = MOONS.get(planet_name)
+    if soa is None:
+        return moons
+    # Same filter as the orbit table, so these line up with the planet's rows
+    raw_moons = [m for m in MOON_SCALE_FACTORS[planet_name] if m.get("a_km", 0) > 0]
+
+    # Mean motion n = sqrt(μ / a³) in rad/s, already computed column-wise in the orbit table
+    for moon, n_mean, M0 in zip(raw_moons, soa["n_mean"].tolist(), soa["M0"].tolist()):
         enhanced_moon = moon.copy()
         enhanced_moon.update({
-            "omega": n,
-            "M": M0_rad,
+            "omega": n_mean,
+            "M": M0,
             "tilt_applied": False
         })
         moons.append(enhanced_moon)
@@ -2185,15 +2369,10 @@ def generate_moons(planet_name):
 
 # ---------------------------- ASTEROID BELT GENERATION ----------------------------
 def update_asteroid_opacity(caller, event):
+    """Distance fade for the whole belt; the per-asteroid view-cone fade runs in the shader."""
     try:
-        cam = pl.camera
-        cam_pos = np.array(cam.position)
-        cam_dir = np.array(cam.direction)
-        cam_dir /= np.linalg.norm(cam_dir)
-
         # Belt roughly centered near 2.7 AU
-        belt_center = np.array([AU_SCALE * 2.7, 0.0, 0.0])
-        dist = np.linalg.norm(cam_pos - belt_center)
+        dist = math.dist(pl.camera.position, (AU_SCALE * 2.7, 0.0, 0.0))
 
         # --- Distance-based fade parameters ---
         visibility_threshold = 0.8 * AU_SCALE
@@ -2207,31 +2386,10 @@ def update_asteroid_opacity(caller, event):
             t = (dist - (visibility_threshold - fade_zone)) / (2 * fade_zone)
             dist_opacity = 1.0 - t
 
-        # --- Angular visibility setup ---
-        vectors_to_asteroids = positions - cam_pos
-        dists = np.linalg.norm(vectors_to_asteroids, axis=1)
-        unit_vectors = vectors_to_asteroids / dists[:, None]
-
-        cos_angles = np.clip(np.sum(unit_vectors * cam_dir, axis=1), -1.0, 1.0)
-        angles = np.arccos(cos_angles)
-
-        visible_angle = np.pi / 3   # ±60° visibility cone
-        fade_zone_angle = np.radians(10)  # 10° fade zone at edges
-
-        angular_opacity = np.ones_like(angles)
-        fade_mask = (angles > (visible_angle - fade_zone_angle)) & (angles < visible_angle)
-        outside = angles >= visible_angle
-
-        # Smooth angular fade near edge
-        t = (angles[fade_mask] - (visible_angle - fade_zone_angle)) / fade_zone_angle
-        angular_opacity[fade_mask] = 1.0 - t
-        angular_opacity[outside] = 0.0
-
-        # Combine both effects (distance + angle)
-        final_opacity = dist_opacity * angular_opacity.mean()  # global belt fade strength
-
-        # Apply to belt actor
-        asteroid_actor.GetProperty().SetOpacity(float(final_opacity))
+        asteroid_uniforms.SetUniformf("beltDistFade", dist_opacity)
+        # tan of the half view angles, so the shader can turn NDC back into view-space angles
+        tan_y = math.tan(math.radians(pl.camera.view_angle) * 0.5)
+        asteroid_uniforms.SetUniform2f("beltTanHalfFov", [tan_y * pl.renderer.GetTiledAspectRatio(), tan_y])
 
     except Exception as e:
         print(f"[WARN] Asteroid opacity update error: {e}")
@@ -2244,26 +2402,20 @@ ASTEROID_OUTER_AU = 3.30
 
 ASTEROID_INNER_R = AU_SCALE * ASTEROID_INNER_AU
 ASTEROID_OUTER_R = AU_SCALE * ASTEROID_OUTER_AU
-rng = np.random.default_rng(42)
-positions = []
-colors = []
-sizes = []
-for _ in range(ASTEROID_COUNT):
-    r = rng.uniform(ASTEROID_INNER_R, ASTEROID_OUTER_R)
-    theta = rng.uniform(0, 2 * np.pi)
-    inc = rng.uniform(-np.radians(5), np.radians(5))
-    z = r * np.sin(inc) * 0.04
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
-    positions.append([x, y, z])
-    reflect_factor = 1.0 - (r - ASTEROID_INNER_R) / (ASTEROID_OUTER_R - ASTEROID_INNER_R)
-    reflect_factor = np.clip(reflect_factor, 0.3, 1.0)  # clamp to avoid extremes
-    g = rng.uniform(0.55, 0.85) * reflect_factor
-    colors.append([g, g * 0.92, g * 0.84])
-    sizes.append(rng.uniform(0.5, 1))
-positions = np.array(positions)
-colors = (np.array(colors) * 255).astype(np.uint8)
-sizes = np.array(sizes )
+# One uniform draw for every asteroid attribute: radius, angle, inclination, grey level, size
+U = RNG.random((ASTEROID_COUNT, 5))
+r = ASTEROID_INNER_R + U[:, 0] * (ASTEROID_OUTER_R - ASTEROID_INNER_R)
+theta = U[:, 1] * (2 * np.pi)
+inc = (U[:, 2] * 2 - 1) * np.radians(5)
+positions = np.column_stack((r * np.cos(theta), r * np.sin(theta), r * np.sin(inc) * 0.04)).astype(np.float32)  # VTK point buffers are float32
+# Inner belt brighter; clamp to avoid extremes
+reflect_factor = np.clip(1.0 - (r - ASTEROID_INNER_R) / (ASTEROID_OUTER_R - ASTEROID_INNER_R), 0.3, 1.0)
+g = (0.55 * 255 + U[:, 3] * (0.3 * 255)) * reflect_factor  # grey level, 0-255
+colors = np.outer(g, [1.0, 0.92, 0.84]).astype(np.uint8)
+sizes = (0.5 + U[:, 4] * 0.5).astype(np.float32)
+ASTEROID_COS_CONE = math.cos(math.pi / 3)                      # ±60° visibility cone edge
+ASTEROID_COS_FADE = math.cos(math.pi / 3 - math.radians(10))  # start of the 10° edge fade
+ASTEROID_COS_RAMP = 1.0 / (ASTEROID_COS_FADE - ASTEROID_COS_CONE)  # (cos - cone) * ramp -> 0..1 across the fade
 asteroid_cloud = pv.PolyData(positions)
 asteroid_cloud.point_data["rgb"] = colors
 asteroid_cloud.point_data["size"] = sizes 
@@ -2271,9 +2423,29 @@ asteroid_actor = pl.add_points(
     asteroid_cloud, scalars="rgb", rgb=True, point_size=2, style='points',  # Set point_size to 5.0
     emissive=True, ambient=0, diffuse=0.4, name="AsteroidBelt", pickable=False
 )
+# Per-asteroid fade on the GPU. Only gl_Position is used (MCVCMatrix is declared by VTK in some
+# shader variants and not others): with t = NDC.xy * tan(half fov), the cosine to the view axis
+# is 1/sqrt(1 + t.t). Alpha = view-cone ramp * belt distance fade (uniform).
+_asteroid_shader = asteroid_actor.GetShaderProperty()
+_asteroid_shader.AddVertexShaderReplacement(
+    "//VTK::Camera::Dec", True,
+    "//VTK::Camera::Dec\nout float beltAlphaVSOut;", False)
+_asteroid_shader.AddVertexShaderReplacement(
+    "//VTK::Light::Impl", True,  # runs after //VTK::PositionVC::Impl has set gl_Position
+    "  vec2 beltT = gl_Position.xy / gl_Position.w * beltTanHalfFov;\n"
+    f"  beltAlphaVSOut = beltDistFade * clamp((inversesqrt(1.0 + dot(beltT, beltT)) - {ASTEROID_COS_CONE:.9f})"
+    f" * {ASTEROID_COS_RAMP:.9f}, 0.0, 1.0);\n"
+    "//VTK::Light::Impl", False)
+_asteroid_shader.AddFragmentShaderReplacement(
+    "//VTK::Normal::Dec", True, "//VTK::Normal::Dec\nin float beltAlphaVSOut;", False)
+_asteroid_shader.AddFragmentShaderReplacement(
+    "//VTK::Color::Impl", True, "//VTK::Color::Impl\n  opacity *= beltAlphaVSOut;", False)
+asteroid_uniforms = _asteroid_shader.GetVertexCustomUniforms()
+asteroid_uniforms.SetUniformf("beltDistFade", 1.0)
+_tan_y = math.tan(math.radians(pl.camera.view_angle) * 0.5)  # refreshed per render in update_asteroid_opacity
+asteroid_uniforms.SetUniform2f("beltTanHalfFov", [_tan_y * pl.window_size[0] / pl.window_size[1], _tan_y])
+asteroid_actor.ForceTranslucentOn()
 #asteroid_actor.GetMapper().SetVBOShiftScaleMethod(False)
-asteroid_actor._belt_angle = 0.0
-asteroid_actor._belt_speed = 0.03
 
 
 # --- Dynamic fade for asteroid belt based on camera distance ---
@@ -2283,6 +2455,41 @@ if hasattr(pl.render_window, "GetInteractor"):
         interactor.AddObserver("RenderEvent", update_asteroid_opacity)
 # ---------------------------- SETUP PLOTTER ----------------------------
 
+# Optional disk cache for generated assets that are identical run to run (decoded
+# textures, comet nuclei). Off unless SOLAR_SYSTEM_CACHE_DIR names a directory.
+CACHE_DIR = os.environ.get("SOLAR_SYSTEM_CACHE_DIR") or None
+# Part of every cache key, so files written by other library versions are never reused
+CACHE_LIB_VERSIONS = (np.__version__, pv.__version__, vtk.vtkVersion.GetVTKVersion())
+
+
+def _cache_path(prefix, key, ext):
+    """File under CACHE_DIR for this key (plus library versions), or None with caching off."""
+    if CACHE_DIR is None:
+        return None
+    digest = hashlib.md5(repr((key, CACHE_LIB_VERSIONS)).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{prefix}_{digest}.{ext}")
+
+
+@functools.lru_cache(maxsize=None)
+def planet_texture(key):
+    """examples.planets.download_<key>(texture=True); with the disk cache on, the decoded
+    pixels are kept as .npy so later launches skip the image decode."""
+    path = _cache_path("tex", key, "npy")
+    if path is None:
+        return getattr(examples.planets, f"download_{key}")(texture=True)
+    try:
+        return pv.Texture(np.load(path))
+    except (OSError, ValueError):
+        pass
+    tex = getattr(examples.planets, f"download_{key}")(texture=True)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(path, tex.to_array())
+    except OSError as e:
+        print(f"[WARN] Could not cache texture {key}: {e}")
+    return tex
+
+
 pv.set_new_attribute(pl, 'pickpoint', np.array([0.0, 0.0, 0.0]))  # Fixed: Use set_new_attribute
 
 # Background
@@ -2293,13 +2500,18 @@ skybox.SetScale(1e6)
 skybox.GetProperty().LightingOff()
 skybox.GetProperty().SetOpacity(1.0)
 skybox.PickableOff()
-pl.add_actor(skybox)
+pl.add_actor(skybox, render=False, remove_existing_actor=False)
+
+_skybox_last_orient = [None]
+
 
 def update_skybox_orientation(caller, event):
     cam = pl.camera
     try:
         orient = cam.GetOrientation()
-        skybox.SetOrientation(orient)
+        if orient != _skybox_last_orient[0]:  # unchanged camera: nothing to re-orient
+            _skybox_last_orient[0] = orient
+            skybox.SetOrientation(orient)
     except Exception:
         pass
 
@@ -2322,52 +2534,52 @@ prograde_sign = -1
 
 # Sun
 sun_mesh = examples.planets.load_sun(radius=SUN_RADIUS)
-sun_texture = examples.planets.download_sun_surface(texture=True)
+sun_texture = planet_texture("sun_surface")
 sun_actor = pl.add_mesh(
     sun_mesh, texture=sun_texture, emissive=True, lighting=False,
-    ambient=1.0, specular=0.0, name='sun'
+    ambient=1.0, specular=0.0, name='sun', render=False, remove_existing_actor=False
 )
 sun_actor.RotateX(AXIAL_TILTS["sun"])
 
 # Planets
 jupiter_mesh = examples.planets.load_jupiter(radius=JUPITER_RADIUS)
-jupiter_texture = examples.planets.download_jupiter_surface(texture=True)
+jupiter_texture = planet_texture("jupiter_surface")
 jupiter_actor = pl.add_mesh(
     jupiter_mesh, texture=jupiter_texture, smooth_shading=True,
-    ambient=0.1, diffuse=0.1, specular=0.01, name='jupiter'
+    ambient=0.1, diffuse=0.1, specular=0.01, name='jupiter', render=False, remove_existing_actor=False
 )
 jupiter_actor.RotateX(prograde_sign * AXIAL_TILTS["jupiter"])
 
 saturn_mesh = examples.planets.load_saturn(radius=SATURN_RADIUS)
-saturn_texture = examples.planets.download_saturn_surface(texture=True)
+saturn_texture = planet_texture("saturn_surface")
 saturn_actor = pl.add_mesh(
     saturn_mesh, texture=saturn_texture, smooth_shading=True,
-    ambient=0.12, diffuse=0.16, specular=0.01, name='saturn'
+    ambient=0.12, diffuse=0.16, specular=0.01, name='saturn', render=False, remove_existing_actor=False
 )
 saturn_actor.RotateX(prograde_sign * AXIAL_TILTS["saturn"])
 
 neptune_mesh = examples.planets.load_neptune(radius=NEPTUNE_RADIUS)
-neptune_texture = examples.planets.download_neptune_surface(texture=True)
+neptune_texture = planet_texture("neptune_surface")
 neptune_actor = pl.add_mesh(
     neptune_mesh, texture=neptune_texture, smooth_shading=True,
-    ambient=0.1, diffuse=0.4, specular=0, name='neptune'
+    ambient=0.1, diffuse=0.4, specular=0, name='neptune', render=False, remove_existing_actor=False
 )
 neptune_actor.RotateX(prograde_sign * AXIAL_TILTS["neptune"])
 
 uranus_mesh = examples.planets.load_uranus(radius=URANUS_RADIUS)
-uranus_texture = examples.planets.download_uranus_surface(texture=True)
+uranus_texture = planet_texture("uranus_surface")
 uranus_actor = pl.add_mesh(
     uranus_mesh, texture=uranus_texture, smooth_shading=True,
-    ambient=0.1, diffuse=0.3, specular=0, name='uranus'
+    ambient=0.1, diffuse=0.3, specular=0, name='uranus', render=False, remove_existing_actor=False
 )
 uranus_actor.RotateX(prograde_sign * AXIAL_TILTS["uranus"])
 
 
 mars_mesh = examples.planets.load_mars(radius=MARS_RADIUS)
-mars_texture = examples.planets.download_mars_surface(texture=True)
+mars_texture = planet_texture("mars_surface")
 mars_actor = pl.add_mesh(
     mars_mesh, texture=mars_texture, smooth_shading=True,
-    ambient=0.15, diffuse=0.05, specular=0.0, name='mars'
+    ambient=0.15, diffuse=0.05, specular=0.0, name='mars', render=False, remove_existing_actor=False
 )
 mars_actor.RotateX(prograde_sign * AXIAL_TILTS["mars"])
 
@@ -2375,7 +2587,7 @@ earth_mesh = examples.planets.load_earth(radius=EARTH_RADIUS)
 earth_texture = examples.load_globe_texture()
 earth_actor = pl.add_mesh(
     earth_mesh, texture=earth_texture, smooth_shading=True,
-    ambient=0.15, diffuse=0.07, specular=0.0, name='earth'
+    ambient=0.15, diffuse=0.07, specular=0.0, name='earth', render=False, remove_existing_actor=False
 )
 
 earth_actor.RotateX(prograde_sign * AXIAL_TILTS["earth"])
@@ -2384,7 +2596,7 @@ earth_actor.SetPosition(EARTH_ORBIT_RADIUS, 0.0, 0.0)
 
 # === MERCURY ===
 mercury_mesh = examples.planets.load_mercury(radius=MERCURY_RADIUS)
-mercury_texture = examples.planets.download_mercury_surface(texture=True)
+mercury_texture = planet_texture("mercury_surface")
 mercury_actor = pl.add_mesh(
 
     mercury_mesh,
@@ -2393,7 +2605,7 @@ mercury_actor = pl.add_mesh(
     ambient=0.1,
     diffuse=0.01,
     specular=0.0,
-    name='mercury'
+    name='mercury', render=False, remove_existing_actor=False
 )
 mercury_actor.RotateX(prograde_sign * AXIAL_TILTS["mercury"])
 mercury_actor.SetPosition(MERCURY_ORBIT_RADIUS, 0.0, 0.0)
@@ -2401,16 +2613,15 @@ mercury_actor.SetPosition(MERCURY_ORBIT_RADIUS, 0.0, 0.0)
 
 # Venus
 venus_mesh = examples.planets.load_venus(radius=VENUS_RADIUS)
-venus_texture = examples.planets.download_venus_surface(texture=True)
+venus_texture = planet_texture("venus_surface")
 venus_actor = pl.add_mesh(
     venus_mesh, texture=venus_texture, smooth_shading=True,
-    ambient=0.15, diffuse=0.014, specular=0.0, name='venus'
+    ambient=0.15, diffuse=0.014, specular=0.0, name='venus', render=False, remove_existing_actor=False
 )
 venus_actor.RotateX(prograde_sign * AXIAL_TILTS["venus"])
 venus_actor.SetPosition(VENUS_ORBIT_RADIUS, 0.0, 0.0)
 
-# Saturn Rings
-ring_meshes = []
+# Saturn Rings (all bands in one mesh / one actor; per-vertex alpha carries each band's opacity)
 ring_definitions = [
     (RING_C_INNER, RING_C_OUTER, "ring_c", (0.25, 0.45)),
     (RING_B_INNER, RING_B_OUTER, "ring_b", (0.65, 0.9)),
@@ -2418,37 +2629,62 @@ ring_definitions = [
     (RING_A_INNER, RING_A_OUTER, "ring_a", (0.45, 0.7))
 ]
 sun_dir = np.array([1.0, 0.2, 0.3]); sun_dir /= np.linalg.norm(sun_dir)
-for inner_km, outer_km, name, opacity_range in ring_definitions:
-    inner_r = km_to_scene_default(inner_km)
-    outer_r = km_to_scene_default(outer_km)
-    ring = pv.Disc(center=(0, 0, 0), inner=inner_r, outer=outer_r, r_res=2, c_res=1600)
-    rpoints = ring.points.copy()
-    rdist = np.linalg.norm(rpoints[:, :2], axis=1)
-    rnorm = (rdist - rdist.min()) / max(1e-9, (rdist.max() - rdist.min()))
-    rng = np.random.default_rng(abs(hash(name)) % (2**32))
-    fine_grain = 0.15 * np.sin(100 * rnorm + rng.random()) + 0.1 * np.sin(400 * rnorm + rng.random()) + 0.05 * rng.normal(0, 1, len(rnorm))
-    coarse_band = 0.3 * np.sin(10 * rnorm + rng.random() * 5)
-    grain = 0.5 * fine_grain + 0.5 * coarse_band
-    grain = np.clip(grain, -0.25, 0.25)
-    base_color = np.stack([
-        0.95 - 0.3 * rnorm + 0.4 * grain,
-        0.92 - 0.35 * rnorm + 0.3 * grain,
-        0.87 - 0.4 * rnorm + 0.2 * grain
-    ], axis=1)
-    base_color = np.clip(base_color, 0, 1)
-    normals = np.tile(np.array([0, 0, 1]), (len(rpoints), 1))
-    lambert = np.clip(0.5 + 0.5 * np.dot(normals, sun_dir), 0, 1).reshape(-1, 1)
-    ring.point_data['colors'] = (base_color * lambert * 255).astype(np.uint8)
-    ring_actor = pl.add_mesh(
-        ring, scalars='colors', rgb=True, smooth_shading=True,
-        ambient=0.8, diffuse=1, specular=1, specular_power=60,
-        name=f'saturn_{name}', opacity=float(opacity_range[0]), lighting=True
-    )
-    ring_actor.SetOrientation(26.7, 0.0, 0.0)
-    ring_meshes.append(ring_actor)
+# Ring plane normal is +z, so the Lambert term is the same for every vertex of every band
+ring_lambert = np.clip(0.5 + 0.5 * sun_dir[2], 0, 1)
+# RGB = base + rnorm * radial tint + grain * grain tint
+RING_TINT = np.array([[0.95, 0.92, 0.87], [-0.3, -0.35, -0.4], [0.4, 0.3, 0.2]])
+# One shared normal-noise pool for every ring (Saturn + Uranus); each ring reads a
+# name-keyed window instead of seeding its own generator
+RING_NOISE_POOL = np.random.default_rng(0).standard_normal(1 << 16).astype(np.float32)
+
+
+def ring_noise(name, n):
+    """n standard-normal samples from RING_NOISE_POOL, at an offset fixed by the ring name."""
+    offset = name_seed(name) % (RING_NOISE_POOL.size - n)
+    return RING_NOISE_POOL[offset:offset + n]
+
+
+ring_bands = [
+    pv.Disc(center=(0, 0, 0), inner=km_to_scene_default(inner_km), outer=km_to_scene_default(outer_km),
+            r_res=2, c_res=1600)
+    for inner_km, outer_km, _, _ in ring_definitions
+]
+# Every band has the same vertex count, so the colour pipeline runs on (bands, N) float32
+# arrays in one pass instead of once per band
+rdist = np.stack([np.linalg.norm(ring.points[:, :2], axis=1) for ring in ring_bands])
+rmin = rdist.min(axis=1, keepdims=True)
+rnorm = (rdist - rmin) / np.maximum(1e-9, rdist.max(axis=1, keepdims=True) - rmin)
+noise = np.stack([ring_noise(name, rnorm.shape[1] + 3) for _, _, name, _ in ring_definitions])
+phase = noise[:, -3:] * 0.5 + 0.5  # three band phases from the tail of each window
+grain = np.sin(100 * rnorm + phase[:, :1])
+grain *= 0.075                                               # 0.5 * fine_grain ...
+grain += 0.05 * np.sin(400 * rnorm + phase[:, 1:2])
+grain += 0.025 * noise[:, :-3]
+grain += 0.15 * np.sin(10 * rnorm + phase[:, 2:] * 5)        # ... + 0.5 * coarse_band
+np.clip(grain, -0.25, 0.25, out=grain)
+tint = RING_TINT.astype(np.float32)
+base_color = tint[0] + rnorm[..., None] * tint[1] + grain[..., None] * tint[2]
+np.clip(base_color, 0, 1, out=base_color)
+base_color *= np.float32(ring_lambert * 255)
+ring_rgba = np.empty(base_color.shape[:2] + (4,), dtype=np.uint8)
+ring_rgba[..., :3] = base_color
+ring_rgba[..., 3] = [[int(op[0] * 255)] for _, _, _, op in ring_definitions]
+for band_id, ring in enumerate(ring_bands):
+    ring.point_data['colors'] = ring_rgba[band_id]
+    ring.cell_data['band'] = np.full(ring.n_cells, band_id, dtype=np.uint8)
+# Bands share boundary radii; keep the seams so each side keeps its own colour
+saturn_ring_mesh = pv.merge(ring_bands, merge_points=False)
+ring_actor = pl.add_mesh(
+    saturn_ring_mesh, scalars='colors', rgba=True, smooth_shading=True,
+    ambient=0.8, diffuse=1, specular=1, specular_power=60,
+    name='saturn_rings', render=False, remove_existing_actor=False, lighting=True
+)
+ring_actor.SetOrientation(26.7, 0.0, 0.0)
+ring_meshes = [ring_actor]
 
 # Uranus Rings
 uranus_ring_actors = []
+uranus_ring_blocks = pv.MultiBlock()
 uranus_real_rings = [
     ("ε", 51100, 52600, "#d1d4d8", 0.60),
     ("α", 44700, 45000, "#999999", 0.50),
@@ -2459,20 +2695,23 @@ for name, inner_km, outer_km, color, opacity in uranus_real_rings:
     inner_r = (inner_km / URANUS_REF_KM) * URANUS_RADIUS
     outer_r = (outer_km / URANUS_REF_KM) * URANUS_RADIUS
     ring = pv.Disc(inner=inner_r, outer=outer_r, r_res=64, c_res=512)
-    ring.rotate_x(98, inplace=True)
     pts = ring.points
     dist = np.linalg.norm(pts[:, :2], axis=1)
     norm_dist = (dist - dist.min()) / (dist.max() - dist.min() + 1e-9)
-    rng_local = np.random.default_rng(abs(hash(name)) % (2**32))
-    grain = 0.08 * np.sin(150 * norm_dist) + 0.03 * rng_local.normal(0, 1, len(norm_dist))
-    base = np.array([int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)]) / 255.0
+    grain = 0.08 * np.sin(150 * norm_dist) + 0.03 * ring_noise(name, len(norm_dist))
+    base = np.array(hex_to_rgb(color), dtype=np.float32)
     rgb = (base * (0.8 + 0.2 * grain[:, None])).clip(0, 1)
     ring.point_data["colors"] = (rgb * 255).astype(np.uint8)
-    actor = pl.add_mesh(
-        ring, scalars="colors", rgb=True, opacity=opacity, smooth_shading=True,
-        ambient=0.35, diffuse=0.8, specular=1, specular_power=80, name=f"uranus_ring_{name}"
-    )
-    uranus_ring_actors.append(actor)
+    uranus_ring_blocks.append(ring, f"uranus_ring_{name}")
+# All three rings under one composite actor; each block keeps its own opacity
+uranus_ring_actor, uranus_ring_mapper = pl.add_composite(
+    uranus_ring_blocks, scalars="colors", rgb=True, smooth_shading=True,
+    ambient=0.35, diffuse=0.8, specular=1, specular_power=80, name="uranus_rings", render=False
+)
+for block_idx, (_, _, _, _, opacity) in enumerate(uranus_real_rings, start=1):  # block 0 is the root
+    uranus_ring_mapper.block_attr[block_idx].opacity = opacity
+uranus_ring_actor.RotateX(98)  # ring plane tilt on the actor; the discs stay in xy so dist above is radial
+uranus_ring_actors.append(uranus_ring_actor)
 
 # Dwarf Planets (with Pluto texture; others procedural)
 dwarf_planets = {
@@ -2486,7 +2725,7 @@ dwarf_planets = {
 dwarf_actors = {}
 # Special Pluto with texture
 pluto_mesh = examples.planets.load_pluto()
-pluto_texture = examples.planets.download_pluto_surface(texture=True)
+pluto_texture = planet_texture("pluto_surface")
 pluto_actor = pl.add_mesh(
     pluto_mesh,
     texture=pluto_texture,
@@ -2494,7 +2733,7 @@ pluto_actor = pl.add_mesh(
     ambient=0.1,
     diffuse=0.2,
     specular=0.0,
-    name="pluto"
+    name="pluto", render=False, remove_existing_actor=False
 )
 pluto_actor.RotateX(AXIAL_TILTS["pluto"])
 pluto_actor.SetPosition(PLUTO_ORBIT_RADIUS, 0.0, 0.0)  # Initial position
@@ -2502,7 +2741,7 @@ dwarf_actors["pluto"] = pluto_actor
 
 # Others procedural
 for name, (radius, color) in {k: v for k, v in dwarf_planets.items() if k != "pluto"}.items():
-    mesh = pv.Sphere(radius=radius, theta_resolution=32, phi_resolution=32)
+    mesh = _unit_moon_sphere(32)[0].copy(deep=False)  # shared unit sphere, sized by the actor
     actor = pl.add_mesh(
         mesh,
         color=color,
@@ -2510,8 +2749,9 @@ for name, (radius, color) in {k: v for k, v in dwarf_planets.items() if k != "pl
         ambient=0.1,
         diffuse=0.2,
         specular=0.0,
-        name=name
+        name=name, render=False, remove_existing_actor=False
     )
+    actor.SetScale(radius)
     actor.RotateX(AXIAL_TILTS[name])
     actor.SetPosition(globals()[f"{name.upper()}_ORBIT_RADIUS"], 0.0, 0.0)  # Initial position
     dwarf_actors[name] = actor
@@ -2533,23 +2773,16 @@ def create_point_actor_safe(plotter, planet_center, orbit_r, name, point_size=PO
     return actor
 
 # -------------------- MOON ACTOR CREATION --------------------
+# One generate_moons call per host (the creation loop below used to call it a second time)
 planet_moons = {
-    "earth": generate_moons("earth"),
-    "mars": generate_moons("mars"),
-    "jupiter": generate_moons("jupiter"),
-    "saturn": generate_moons("saturn"),
-    "uranus": generate_moons("uranus"),
-    "neptune": generate_moons("neptune"),
-    "pluto": generate_moons("pluto"),
-    "eris": generate_moons("eris"),
-    "haumea": generate_moons("haumea"),
-    "makemake": generate_moons("makemake"),
+    planet: generate_moons(planet)
+    for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto", "eris", "haumea", "makemake", "ceres"]
 }
 
 # Build moon_actors dict 
 moon_actors = {}
-for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto", "eris", "haumea", "makemake", "ceres"]:
-    moon_data_list = generate_moons(planet)
+tiny_moon_holders = []  # point-LOD moon actors, in creation order
+for planet, moon_data_list in planet_moons.items():
     moon_actors[planet] = []
     planet_name = planet  # For consistent use in conditionals/naming
 
@@ -2557,20 +2790,16 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
         radius_km = moon_data["radius_km"]
         radius_scene = radius_km * SIZEKM_TO_SCENE * GLOBAL_SCALE_MULTIPLIER
 
+        full_name = f"{planet_name}_{moon_data['name'].lower().replace(' ', '_')}"
+        short_name = moon_data["name"]
+
         # LOD: Tiny moons as points (per your thresholds, e.g., POINT_LOD_THRESHOLD)
         if radius_scene < POINT_LOD_THRESHOLD:
-            # Fast point proxy for tiny moons
-            point_actor = pl.add_mesh(
-                pv.Sphere(radius=radius_scene * 0.1, center=[0, 0, 0]),
-                color='lightgray',
-                point_size=POINT_DISPLAY_SIZE,
-                name=f"{planet_name}_{moon_data['name']}_point",
-                render_points_as_spheres=True,
-                pickable=False
-            )
-            actor = point_actor
-            smooth_shading = False
-            theta_res = phi_res = 8  # Unused for points
+            # Drawn by the shared tiny_moon_cloud; the actor is an unrendered
+            # transform holder so focus/zoom keep working on it like any moon.
+            actor = pv.Actor()
+            moon_data["point_lod"] = True
+            tiny_moon_holders.append(actor)
         else:
             # Resolution / shading logic (your original)
             if radius_scene >= 0.1:  # Large/medium moons
@@ -2582,16 +2811,13 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
                 phi_res = 16 if radius_km > 10 else 8
                 smooth_shading = False
 
-            full_name = f"{planet_name}_{moon_data['name'].lower().replace(' ', '_')}"
-            short_name = moon_data["name"]
-
             # SPECIAL CASE: EARTH'S MOON (real mesh + texture)
             if planet_name == "earth" and short_name == "Moon":
                 try:
                     # Real Moon mesh (scaled to scene)
                     luna_mesh = examples.planets.load_moon(radius=radius_scene)
-                    # Real texture (cached by PyVista)
-                    luna_tex = examples.planets.download_moon_surface(texture=True)
+                    # Real texture (decoded once per run; kept on disk when SOLAR_SYSTEM_CACHE_DIR is set)
+                    luna_tex = planet_texture("moon_surface")
                     # Exact same call as your planets (lighting, etc.)
                     luna_actor = pl.add_mesh(
                         luna_mesh,
@@ -2600,18 +2826,9 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
                         ambient=0.15,
                         diffuse=0.03,
                         specular=0.0,
-                        name=full_name,
+                        name=full_name, render=False, remove_existing_actor=False,
                         lighting=True
                     )
-                    # Optional invisible fallback (for focus/zoom code)
-                    fallback = pv.Sphere(radius=radius_scene * 0.05, theta_resolution=8, phi_resolution=8)
-                    pl.add_mesh(
-                        fallback,
-                        color="#ffffff",
-                        opacity=0.0,
-                        name=f"{full_name}_debug",
-                        pickable=False
-                    )
                     actor = luna_actor  # Use textured actor
                 except Exception as e:
                     print(f"[WARN] Failed to load Moon: {e}. Using fallback sphere.")
@@ -2625,20 +2842,16 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
                         ),
                         color='lightblue',
                         smooth_shading=smooth_shading,
-                        name=full_name,
+                        name=full_name, render=False, remove_existing_actor=False,
                         lighting=True
                     )
             else:
-                sphere = pv.Sphere(
-                    radius=radius_scene,
-                    theta_resolution=theta_res,
-                    phi_resolution=phi_res,
-                    center=[0, 0, 0]
-                )
+                # Shared unit sphere (own point_data per moon), sized by the actor's scale
+                sphere = _unit_moon_sphere(theta_res)[0].copy(deep=False)
                 base_hex = moon_colors.get(short_name, "#C0C0C0")  # Default gray
                 # Call your function (replace with exact if different)
                 try:
-                    actor = procedural_moon_actor(sphere, base_hex, short_name)
+                    actor = procedural_moon_actor(sphere, base_hex, short_name, res=theta_res)
                 except NameError:
                     # Mock: Simple colored sphere if function missing
                     print(f"[WARN] procedural_moon_actor not found for {short_name}; using basic sphere.")
@@ -2648,9 +2861,10 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
                         smooth_shading=smooth_shading,
                         ambient=0.3,
                         diffuse=0.7,
-                        name=full_name,
+                        name=full_name, render=False, remove_existing_actor=False,
                         lighting=True
                     )
+                actor.SetScale(radius_scene)
 
         actor.SetPosition(0, 0, 0)
         key = f"{planet_name}_{idx}"
@@ -2665,37 +2879,24 @@ for planet in ["earth", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto
             print(f"[INFO] Real Moon added → {full_name} (radius {radius_scene:.4f} scene units)")
 
 print(f"Created {sum(len(moons) for moons in moon_actors.values())} moon actors across {len(moon_actors)} planets.")
+
+# Tiny moons share one point cloud: one draw call instead of one Sphere actor each.
+# Points follow the point-LOD moons in moon_actors order, start where their actors are,
+# and are refreshed by the animator. Point moons get no halo (there is no mesh to wrap).
+tiny_moon_cloud = pv.PolyData(np.array([a.GetPosition() for a in tiny_moon_holders], dtype=np.float32).reshape(-1, 3))
+tiny_moon_actor = pl.add_mesh(
+    tiny_moon_cloud, style='points', color='lightgray',
+    point_size=POINT_DISPLAY_SIZE, render_points_as_spheres=True,
+    name="tiny_moons", render=False, remove_existing_actor=False, pickable=False
+)
 def get_orbit_points(elements, mu=GM_SUN, num_points=200):
-    a_km = elements["a_km"]
-    e = elements["e"]
-    i_deg = elements["i_deg"]
-    Omega_deg = elements["Omega_deg"]
-    omega_deg = elements["omega_deg"]
-    points = []
-    Ms = np.linspace(0, 2 * math.pi, num_points)
-    for M in Ms:
-        E = solve_kepler(M, e)
-        sin_v = math.sqrt(1.0 - e**2) * math.sin(E) / (1.0 - e * math.cos(E))
-        cos_v = (math.cos(E) - e) / (1.0 - e * math.cos(E))
-        v = math.atan2(sin_v, cos_v)
-        r = a_km * (1.0 - e * math.cos(E))
-        x_orb = r * math.cos(v)
-        y_orb = r * math.sin(v)
-        z_orb = 0.0
-        i = math.radians(i_deg)
-        Omega = math.radians(Omega_deg)
-        omega = math.radians(omega_deg)
-        x1 = x_orb * math.cos(omega) - y_orb * math.sin(omega)
-        y1 = x_orb * math.sin(omega) + y_orb * math.cos(omega)
-        z1 = 0.0
-        x2 = x1
-        y2 = y1 * math.cos(i) - z1 * math.sin(i)
-        z2 = y1 * math.sin(i) + z1 * math.cos(i)
-        x3 = x2 * math.cos(Omega) - y2 * math.sin(Omega)
-        y3 = x2 * math.sin(Omega) + y2 * math.cos(Omega)
-        z3 = z2
-        points.append([x3, y3, z3])
-    return np.array(points) * KM_TO_SCENE
+    """(num_points, 3) scene-space samples of a closed (e < 1) orbit, evenly spaced in mean anomaly."""
+    a_km, e = elements["a_km"], elements["e"]
+    E = solve_kepler_vec(np.linspace(0, 2 * np.pi, num_points), e)
+    # Perifocal (a(cosE - e), b sinE), rotated by the body's cached Rz(Omega) Rx(i) Rz(omega)
+    xy = np.column_stack((a_km * (np.cos(E) - e), a_km * math.sqrt(1.0 - e * e) * np.sin(E)))
+    R2 = np.reshape(_pqw_rotation(elements["Omega_deg"], elements["i_deg"], elements["omega_deg"]), (3, 2))
+    return xy @ R2.T * KM_TO_SCENE
 
 
 
@@ -2704,50 +2905,41 @@ def get_orbit_points(elements, mu=GM_SUN, num_points=200):
 # --------------------------------------------------------------
 # Assume moon_colors dict is in scope from procedural_moon_actor (e.g., {"io": "#FFFF00", ...})
 # If not, define a basic one here or fallback to hex-to-rgb conversion
-def hex_to_rgb(hex_str):
-    """Convert hex color to RGB array (0-1)."""
-    hex_str = hex_str.lstrip('#')
-    return np.array([int(hex_str[i:i+2], 16)/255.0 for i in (0, 2, 4)])
+# Halo base colours (fallback/defaults), parsed once into a float32 table; the last row is the
+# faint white-blue default for tiny/unknown moons. Rows are read-only and handed out as is.
+_HALO_PALETTE = {
+    "titan": [1.0, 0.6, 0.2],      # orange haze
+    "io": [1.0, 0.9, 0.4],          # sulfur yellow
+    "europa": [0.8, 0.9, 1.0],      # icy blue-white
+    "enceladus": [0.9, 0.95, 1.0],  # water-vapor white
+    "triton": [0.2, 0.4, 0.8],      # blue nitrogen ice
+    "ganymede": [0.6, 0.6, 0.6],    # gray cratered
+    "callisto": [0.4, 0.4, 0.4],    # dark gray icy
+    "rhea": [0.8, 0.8, 0.8],        # bright icy
+    "dione": [0.7, 0.75, 0.8],      # pale icy
+    "hyperion": [0.5, 0.5, 0.5],    # spongy gray
+    "iapetus": [0.3, 0.3, 0.3],     # dark leading side
+    "moon": [0.9, 0.9, 0.8],        # lunar gray
+    "phobos": [0.4, 0.3, 0.2],      # rusty regolith
+    "deimos": [0.5, 0.4, 0.3],      # dusty brown
+    "charon": [0.6, 0.7, 0.8],      # reddish ice
+    "proteus": [0.5, 0.5, 0.5],     # irregular gray
+    "nereid": [0.7, 0.6, 0.5],      # reddish
+}
+HALO_COLOR_ROW = {name: i for i, name in enumerate(_HALO_PALETTE)}
+HALO_COLOR_ARR = np.array(list(_HALO_PALETTE.values()) + [[0.9, 0.95, 1.0]], dtype=np.float32)
+HALO_COLOR_ARR.flags.writeable = False
 
 
 def get_moon_base_color(name, moon_colors=None):
     """Get base RGB from moon_colors dict or default palette."""
     name_lower = name.lower()
     if moon_colors and name_lower in moon_colors:
-        return hex_to_rgb(moon_colors[name_lower])
-    
-    # Extended palette (fallback/defaults)
-    palette = {
-        "titan": [1.0, 0.6, 0.2],      # orange haze
-        "io": [1.0, 0.9, 0.4],          # sulfur yellow
-        "europa": [0.8, 0.9, 1.0],      # icy blue-white
-        "enceladus": [0.9, 0.95, 1.0],  # water-vapor white
-        "triton": [0.2, 0.4, 0.8],      # blue nitrogen ice
-        "ganymede": [0.6, 0.6, 0.6],    # gray cratered
-        "callisto": [0.4, 0.4, 0.4],    # dark gray icy
-        "rhea": [0.8, 0.8, 0.8],        # bright icy
-        "dione": [0.7, 0.75, 0.8],      # pale icy
-        "hyperion": [0.5, 0.5, 0.5],    # spongy gray
-        "iapetus": [0.3, 0.3, 0.3],     # dark leading side
-        "moon": [0.9, 0.9, 0.8],        # lunar gray
-        "phobos": [0.4, 0.3, 0.2],      # rusty regolith
-        "deimos": [0.5, 0.4, 0.3],      # dusty brown
-        "charon": [0.6, 0.7, 0.8],      # reddish ice
-        "proteus": [0.5, 0.5, 0.5],     # irregular gray
-        "nereid": [0.7, 0.6, 0.5],      # reddish
-    }
-    return np.array(palette.get(name_lower, [0.9, 0.95, 1.0]))  # default faint white-blue for tiny/unknown
-
-def add_atmosphere_halo(moon_actor, moon_data, parent_radius_km=None, moon_colors=None):
-    """
-    Adds a glowing atmospheric shell around a moon actor.
-    - moon_actor : the PyVista actor of the moon
-    - moon_data  : dict from MOON_SCALE_FACTORS (must contain radius_km)
-    - parent_radius_km : optional – for very tiny moons we cap the halo size
-    - moon_colors : optional dict for procedural colors (integrates with existing)
-    """
-    global pl  # Assume global plotter in scope
+        return np.array(hex_to_rgb(moon_colors[name_lower]))
+    return HALO_COLOR_ARR[HALO_COLOR_ROW.get(name_lower, -1)]
 
+def _halo_shell(moon_data, moon_colors=None):
+    """Origin-centred halo sphere with per-vertex RGBA "colors" (limb glow + noise + alpha)."""
     # 1. Base radius (scene units)
     radius_km = moon_data["radius_km"]
     radius_scene = radius_km * SIZEKM_TO_SCENE * GLOBAL_SCALE_MULTIPLIER
@@ -2772,61 +2964,82 @@ def add_atmosphere_halo(moon_actor, moon_data, parent_radius_km=None, moon_color
     # 4. Limb-brightening gradient (brighter at edge/limb)
     normals = halo.point_normals
     # Fake view dir toward "sun" (static; could be dynamic in update if needed)
-    view_dir = np.array([1.0, 0.3, 0.2])
+    view_dir = np.array([1.0, 0.3, 0.2], dtype=np.float32)  # float32 like the normals; colours end as uint8
     view_dir /= np.linalg.norm(view_dir)
-    limb_factor = np.abs(np.dot(normals, view_dir))
-    limb_factor = np.clip(limb_factor, 0.0, 1.0)  # 0 at back, 1 at front (but abs for rim glow)
+    limb_factor = np.abs(normals @ view_dir)
+    np.clip(limb_factor, 0.0, 1.0, out=limb_factor)  # 0 at back, 1 at front (but abs for rim glow)
 
     # 5. Base color from palette or procedural (integrates with moon_colors)
     name = moon_data["name"]
     base_rgb = get_moon_base_color(name, moon_colors)
 
     # 6. Apply gradient + micro-noise for realism
-    rng = np.random.default_rng(abs(hash(name)) % (2**32))
-    noise = rng.normal(0.0, 0.05 if is_tiny else 0.07, size=limb_factor.shape)
-    intensity = 0.3 + 0.7 * limb_factor + noise  # Slightly lower base for subtlety
+    rng = moon_rng(name)
+    intensity = rng.standard_normal(limb_factor.shape, dtype=np.float32)
+    intensity *= 0.05 if is_tiny else 0.07
+    intensity += 0.3 + 0.7 * limb_factor  # Slightly lower base for subtlety
     if is_tiny:
         intensity *= 1.5  # Brighter for tiny moons to "feel" atmospheric
-    intensity = np.clip(intensity, 0.0, 1.0)
+    np.clip(intensity, 0.0, 1.0, out=intensity)
 
     # 7. Alpha: Stronger at limb, fade to near-transparent inward; boost for tiny
     alpha = (limb_factor * 0.5 + 0.05)  # 0.05-0.55 base
     if is_tiny:
         alpha *= 1.2  # More opaque for visibility
-    alpha = np.clip(alpha, 0.05, 0.8)
+    np.clip(alpha, 0.05, 0.8, out=alpha)
 
     # 8. Combine to RGBA (per-vertex colors with alpha for proper blending)
-    rgba = np.column_stack([base_rgb * intensity[:, None], alpha])
-    halo.point_data["colors"] = (rgba * 255).astype(np.uint8)
+    intensity *= 255
+    alpha *= 255
+    rgba = np.empty((len(alpha), 4), dtype=np.uint8)  # products are written straight into it
+    np.multiply(np.asarray(base_rgb, dtype=np.float32), intensity[:, None], out=rgba[:, :3], casting="unsafe")
+    rgba[:, 3] = alpha
+    halo.point_data["colors"] = rgba
+    return halo
+
 
-    # 9. Add to plotter: Use rgb=True for RGBA, opacity=1.0 to use alpha channel, no lighting for glow
+def add_atmosphere_halo(moon_actor, moon_data, parent_radius_km=None, moon_colors=None):
+    """
+    Adds a glowing atmospheric shell around a moon actor.
+    - moon_actor : the PyVista actor of the moon
+    - moon_data  : dict from MOON_SCALE_FACTORS (must contain radius_km)
+    - parent_radius_km : optional – for very tiny moons we cap the halo size
+    - moon_colors : optional dict for procedural colors (integrates with existing)
+    """
+    global pl  # Assume global plotter in scope
+    halo = _halo_shell(moon_data, moon_colors)
+
+    # Add to plotter: Use rgb=True for RGBA, opacity=1.0 to use alpha channel, no lighting for glow
     halo_actor = pl.add_mesh(
         halo,
         scalars="colors",
         rgb=True,  # Enables RGBA interpretation (alpha from scalars)
         opacity=1.0,  # Full opacity; alpha handled by scalars
         lighting=False,  # No lighting for uniform glow
-        name=f"{moon_actor.name}_halo",
+        name=f"{moon_actor.name}_halo", render=False, remove_existing_actor=False,
         pickable=False,
         ambient=0.8,
         diffuse=0.2,
         specular=0.0
     )
 
-    # 10. Enable scalar visibility for colors/alpha (VTK mapper tweaks for blending)
+    # Enable scalar visibility for colors/alpha (VTK mapper tweaks for blending)
     mapper = halo_actor.GetMapper()
     mapper.ScalarVisibilityOn()
     mapper.SetScalarModeToUsePointFieldData()
     mapper.SelectColorArray("colors")
 
-    # 11. Property tweaks for translucent/glow effect (VTK-level)
+    # Property tweaks for translucent/glow effect (VTK-level)
     prop = halo_actor.GetProperty()
     prop.SetOpacity(1.0)  # Use alpha from scalars
     prop.SetInterpolationToPhong()  # Smooth shading
     # For additive-like glow in translucent mode (fallback if no shader)
     prop.ShadingOn()
+    # Translucent geometry is drawn unsorted (no depth peeling), so a shell's far side
+    # only showed through where its triangles happened to come first; cull it instead
+    prop.BackfaceCullingOn()
 
-    # 12. Parent-child sync (for animation loop)
+    # Parent-child sync (for animation loop)
     halo_actor.SetPosition(moon_actor.GetPosition())
     halo_actor.SetOrientation(moon_actor.GetOrientation())
 
@@ -2838,24 +3051,35 @@ def add_atmosphere_halo(moon_actor, moon_data, parent_radius_km=None, moon_color
 # ------------------------------------------------------------------
 #  APPLY TO EVERY MOON 
 # ------------------------------------------------------------------
-halo_actors = {}
-halo_parents = {}
+# One halo actor per mesh moon, kept on its moon by sync_moon_halos
+halo_actors = {}   # per-comet halos (opacity/visibility vary per comet)
+moon_halo_pairs = []   # (halo actor, moon actor)
 
 for planet, moons in moon_actors.items():
     for moon_data, moon_actor in moons:
-        name = moon_data["name"]
-        full_key = f"{planet}_{name.lower().replace(' ', '_')}"
-        # Skip if no radius (edge case)
+        # Skip if no radius (edge case); point-LOD moons have no mesh to wrap
         if "radius_km" not in moon_data or moon_data["radius_km"] <= 0:
             continue
+        if moon_data.get("point_lod"):
+            continue
         halo = add_atmosphere_halo(moon_actor, moon_data, moon_colors=moon_colors)  # Pass procedural colors
-        if halo is not None:
-            halo_actors[full_key] = halo
-            halo_parents[full_key] = moon_actor  # NEW: Map full_key to parent actor
+        moon_halo_pairs.append((halo, moon_actor))
+
+
+def sync_moon_halos():
+    """Place every moon's halo on its moon (position + orientation of the moon actor)."""
+    for halo, moon_actor in moon_halo_pairs:
+        halo.SetPosition(moon_actor.GetPosition())
+        halo.SetOrientation(moon_actor.GetOrientation())
+
 
 
 
 
+# Nucleus LOD: 180x180 (~32k points) is indistinguishable from 360x360 at comet zoom levels
+NUCLEUS_RES = 180
+NUCLEUS_SMOOTH_ITER = 15
+
 
 def _high_res_sphere(radius, theta_res=360, phi_res=360):
     return pv.Sphere(radius=radius,
@@ -2871,22 +3095,96 @@ def _layered_noise(pts, dirs, rng, warp, crater, noise, radius):
     distortion = A*dirs[:,0] + B*dirs[:,1] + C*dirs[:,2]
     pts = pts + dirs * (distortion * radius * 0.35)[:, None]
 
-    # 2. Mid-frequency crater field (many small craters)
+    # 2. Mid-frequency crater field (many small craters); draws keep the original
+    #    per-crater order, then every crater is cut in one (N, k) pass
     n_craters = rng.integers(8, 15)
-    for _ in range(n_craters):
-        center = rng.normal(0, 1, 3)
-        center /= np.linalg.norm(center)
-        dot = np.dot(dirs, center)
-        mask = dot > rng.uniform(0.85, 0.94)
-        depth = (dot[mask] - 0.85) / 0.09 * crater * radius
-        pts[mask] -= dirs[mask] * depth[:, None]
+    centers = np.empty((n_craters, 3))
+    thresh = np.empty(n_craters)
+    for k in range(n_craters):
+        centers[k] = rng.normal(0, 1, 3)
+        thresh[k] = rng.uniform(0.85, 0.94)
+    centers /= np.linalg.norm(centers, axis=1)[:, None]
+    dot = dirs @ centers.T
+    depth = np.where(dot > thresh, dot - 0.85, 0.0).sum(axis=1)
+    depth *= crater * radius / 0.09
+    pts -= dirs * depth[:, None]
 
     # 3. High-frequency surface dust/roughness
-    noise_vec = rng.normal(0, noise, pts.shape[0])
+    noise_vec = rng.standard_normal(pts.shape[0], dtype=np.float32)
+    noise_vec *= noise
     pts += dirs * (noise_vec * radius * 0.04)[:, None]
 
     return pts
 
+def _build_nucleus_mesh(name, radius, rough_base):
+    """Comet nucleus: noisy high-res sphere, smoothed, with roughness/subsurface data and a random tilt."""
+    rng = np.random.default_rng(name_seed(name))
+
+    # 1) High res sphere (UNCHANGED)
+    sphere = _high_res_sphere(radius, NUCLEUS_RES, NUCLEUS_RES)
+    pts = sphere.points.copy()
+    dirs = pts / np.linalg.norm(pts, axis=1)[:, None]
+
+    # 2) Apply procedural noise (UNCHANGED)
+    pts = _layered_noise(
+        pts, dirs, rng,
+        warp=0.42, crater=0.26, noise=0.22,
+        radius=radius
+    )
+
+    # 3) Build nucleus mesh (UNCHANGED)
+    mesh = pv.PolyData(pts, sphere.faces)
+    mesh = mesh.triangulate()
+    mesh.clean(tolerance=1e-6, inplace=True)
+    mesh.compute_normals(
+        cell_normals=False,
+        point_normals=True,
+        consistent_normals=True,
+        inplace=True
+    )
+    # Laplacian smoothing spreads ~sqrt(n_iter) edges; 4x fewer iterations at half the
+    # resolution covers the same surface distance as the old 60 at 360x360
+    mesh = mesh.smooth(n_iter=NUCLEUS_SMOOTH_ITER, relaxation_factor=0.18)
+
+    # 4) Roughness / subsurface data (UNCHANGED)
+    rough = np.ones(mesh.n_points) * rough_base
+    crater_mask = rng.standard_normal(mesh.n_points, dtype=np.float32)
+    crater_mask *= 0.2
+    rough[crater_mask > 0.6] = 0.65
+    subsurface = np.full(mesh.n_points, 0.12)
+    subsurface[crater_mask < -0.4] = 0.04
+    mesh["roughness"] = rough
+    mesh["subsurface"] = subsurface
+
+    # 5) Random rotation: kept with the mesh (and its disk cache) and applied by the actor
+    mesh.field_data["tilt_deg"] = rng.uniform(0, 360, 3)
+    return mesh
+
+
+# The nucleus depends only on (name, radius, roughness), so with the disk cache on it is
+# kept as .vtp. Bump the version whenever _build_nucleus_mesh changes its output.
+NUCLEUS_CACHE_VERSION = 4
+
+
+def _cached_nucleus_mesh(name, radius, rough_base):
+    """_build_nucleus_mesh, cached on disk across launches when CACHE_DIR is set."""
+    key = (NUCLEUS_CACHE_VERSION, NUCLEUS_RES, NUCLEUS_SMOOTH_ITER, name, float(radius), float(rough_base))
+    path = _cache_path("nucleus", key, "vtp")
+    if path is None:
+        return _build_nucleus_mesh(name, radius, rough_base)
+    if os.path.exists(path):
+        try:
+            return pv.read(path)
+        except (OSError, ValueError):
+            pass
+    mesh = _build_nucleus_mesh(name, radius, rough_base)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        mesh.save(path)
+    except OSError as e:
+        print(f"[WARN] Could not cache comet nucleus: {e}")
+    return mesh
+
 # --------------------------------------------------------------
 # MAIN FUNCTION
 # --------------------------------------------------------------
@@ -2935,65 +3233,30 @@ def create_comet_actors(pl, elements):
         "lovejoy": {"albedo": "#6b6b6b", "rough": 0.90, "metal": 0.0,
                     "coma_op": 0.09, "tail_dust": "#e6c9a8", "tail_ion": "#87CEEB"},
     }
+    # Initial state for every comet in one batched solve
+    cols = {k: np.array([el[k] for el in elements.values()], dtype=np.float64)
+            for k in ("a_km", "e", "M0_deg", "epoch_jd")}
+    rows = [ORBIT_INDEX.get(("sun", name)) for name in elements]
+    R = ORBIT_R_PQW_TO_ECI[rows] if None not in rows else None  # table comets: rotations already built
+    if R is None:
+        cols.update({k: np.array([el[k] for el in elements.values()], dtype=np.float64)
+                     for k in ("i_deg", "Omega_deg", "omega_deg")})
+    init_pos_km, init_vel_km_s, _ = kepler_to_state_batch(
+        cols["a_km"], cols["e"], cols.get("i_deg"), cols.get("Omega_deg"), cols.get("omega_deg"),
+        cols["M0_deg"], cols["epoch_jd"], cols["epoch_jd"], mu=GM_SUN, R=R
+    )
     # ------------------------------------
     # MAIN LOOP
     # ------------------------------------
-    for name, el in elements.items():
+    for (name, el), pos_km, vel_km_s in zip(elements.items(), init_pos_km, init_vel_km_s):
         # Use lowercase name for profile lookup
         profile_name = name.lower()
         p = profiles.get(profile_name, profiles["halley"])
         radius = el["radius_km"] * SIZEKM_TO_SCENE
-        rng = np.random.default_rng(hash(name) % (2**32))
+        # 1-5) Noisy, smoothed nucleus plus its random tilt (kept on disk when SOLAR_SYSTEM_CACHE_DIR is set)
+        mesh = _cached_nucleus_mesh(name, radius, p["rough"])
       
-        # 1) High res sphere (UNCHANGED)
-        sphere = _high_res_sphere(radius)
-        pts = sphere.points.copy()
-        dirs = pts / np.linalg.norm(pts, axis=1)[:, None]
-      
-        # 2) Apply procedural noise (UNCHANGED)
-        pts = _layered_noise(
-            pts, dirs, rng,
-            warp=0.42, crater=0.26, noise=0.22,
-            radius=radius
-        )
-      
-        # 3) Build nucleus mesh (UNCHANGED)
-        mesh = pv.PolyData(pts, sphere.faces)
-        mesh = mesh.triangulate()
-        mesh.clean(tolerance=1e-6, inplace=True)
-        mesh.compute_normals(
-            cell_normals=False,
-            point_normals=True,
-            consistent_normals=True,
-            inplace=True
-        )
-        mesh = mesh.smooth(n_iter=60, relaxation_factor=0.18)
-      
-        # 4) Roughness / subsurface data (UNCHANGED)
-        rough = np.ones(mesh.n_points) * p["rough"]
-        crater_mask = rng.normal(0, 0.2, mesh.n_points)
-        rough[crater_mask > 0.6] = 0.65
-        subsurface = np.full(mesh.n_points, 0.12)
-        subsurface[crater_mask < -0.4] = 0.04
-        mesh["roughness"] = rough
-        mesh["subsurface"] = subsurface
-      
-        # 5) Random rotation (UNCHANGED)
-        r = rng.uniform(0, 360, 3)
-        mesh.rotate_x(r[0], inplace=True)
-        mesh.rotate_y(r[1], inplace=True)
-        mesh.rotate_z(r[2], inplace=True)
-      
-        # 6) Compute initial comet position (UNCHANGED)
-        result = kepler_to_state(
-            el["a_km"], el["e"], el["i_deg"], el["Omega_deg"],
-            el["omega_deg"], el["M0_deg"], el["epoch_jd"], el["epoch_jd"],
-            mu=GM_SUN
-        )
-      
-        mx_km, my_km, mz_km, vel_km_s, v_deg = result
-      
-        pos_km = np.array([mx_km, my_km, mz_km])
+        # 6) Initial comet position (from the batched solve above)
         if not np.all(np.isfinite(pos_km)):
             print(f"[WARN] Invalid initial pos for comet {name}, fallback to safe position.")
             pos_km = np.array([0, 0, NEPTUNE_AU * AU_KM])
@@ -3012,8 +3275,13 @@ def create_comet_actors(pl, elements):
             opacity=1.0,
             smooth_shading=True,
             specular=0.03,
-            name=f"nucleus_{name}"
+            name=f"nucleus_{name}", render=False, remove_existing_actor=False
         )
+        # Same order as rotating the points about x, then y, then z (actor transform premultiplies)
+        tilt_x, tilt_y, tilt_z = mesh.field_data["tilt_deg"]
+        nucleus_actor.RotateZ(tilt_z)
+        nucleus_actor.RotateY(tilt_y)
+        nucleus_actor.RotateX(tilt_x)
         nucleus_actor.SetPosition(*pos_scene)
       
     
@@ -3098,11 +3366,63 @@ class SolarSystemAnimator:
         self.ring_actors = rings
         self.uranus_ring_actors = uranus_rings
         self.asteroid_actor = asteroids
+        # Checked once here, so the per-frame belt update needs no guard
+        self.asteroid_valid = False
+        if self.asteroid_actor:
+            # The pyvista dataset behind the mapper (the raw GetInput() has no numpy .points)
+            self.asteroid_cloud = self.asteroid_actor.mapper.dataset
+            self.asteroid_valid = self.asteroid_cloud.GetNumberOfPoints() > 0
+        if self.asteroid_valid:
+            # Belt rotation only moves asteroids along their circles, so each one's rate is fixed
+            belt_r_km = np.hypot(self.asteroid_cloud.points[:, 0], self.asteroid_cloud.points[:, 1]) / KM_TO_SCENE
+            self.asteroid_omega = np.sqrt(GM_SUN / belt_r_km**3)
+            # In-plane start positions as x + iy; each frame rotates them by the total angle.
+            # Per-frame increments (~1e-9 rad at real time) would vanish in float32.
+            belt_xy = self.asteroid_cloud.points[:, :2]
+            self.asteroid_xy0 = (belt_xy[:, 0] + 1j * belt_xy[:, 1]).astype(np.complex64)
+            self.asteroid_xy = np.empty_like(self.asteroid_xy0)
         self.sun_actor = sun_actor
         self.comet_actors = comet_actors or {}
-        self.prev_comet_pos = {}
         self.total_sim_time = 0.0
 
+        # ----- orbit-table rows for batched propagation ------------------------
+        TINY_MOON_THRESHOLD = 150000  # km; closer moons run at TINY_MOON_SCALE
+        TINY_MOON_SCALE = 0.1
+        self.moon_list, self.moon_rows, self.moon_time_scale = [], [], []
+        for planet_name, moons in self.moon_actors.items():
+            for moon, actor in moons:
+                self.moon_list.append((planet_name, moon, actor))
+                self.moon_rows.append(ORBIT_INDEX[(planet_name, moon["name"])])
+                self.moon_time_scale.append(
+                    TINY_MOON_SCALE if moon.get("a_km", 0) < TINY_MOON_THRESHOLD else 1.0)
+        self.moon_rows = np.array(self.moon_rows, dtype=np.intp)
+        # Last smoothed scene position per moon (the smoothing state; mirrors the actors)
+        self.moon_positions = np.array([actor.GetPosition() for _, _, actor in self.moon_list]).reshape(-1, 3)
+        self.moon_is_point = np.array([moon.get("point_lod", False) for _, moon, _ in self.moon_list], dtype=bool)
+        self.tiny_moon_idx = np.flatnonzero(self.moon_is_point)
+        self.moon_radius_scene = np.array([moon["radius_km"] for _, moon, _ in self.moon_list]) * SIZEKM_TO_SCENE * GLOBAL_SCALE_MULTIPLIER
+        self.moon_spin_pending = np.zeros(len(self.moon_list))  # deg of spin not yet pushed to the actor
+        self.moon_time_scale = np.array(self.moon_time_scale)
+        # Spin rate per moon (deg per sim second); synchronous when no period is listed
+        spin_period = np.array([ROTATION_PERIOD.get(ORBIT_NAMES[row][1].lower(), np.nan) for row in self.moon_rows])
+        spin_period = np.where(np.isnan(spin_period), 2 * np.pi / ORBIT_N_MEAN[self.moon_rows], spin_period)
+        spin_scale = self.moon_time_scale if TINY_MOON_SPIN_SCALE_MATCH else 1.0
+        self.moon_spin_rate = np.divide(360.0 * spin_scale, spin_period,
+                                        out=np.zeros(len(self.moon_rows)), where=spin_period != 0)
+        self.comet_rows = np.array([ORBIT_INDEX[("sun", name)] for name in self.comet_actors], dtype=np.intp)
+        # Moons then comets: one propagation per frame into a reused (N,3) buffer
+        self.body_rows = BODY_ORBIT_ROWS
+        self.orbit_rows = np.concatenate((self.moon_rows, self.comet_rows, self.body_rows))
+        self.orbit_time_scale = np.concatenate((self.moon_time_scale, np.ones(len(self.comet_rows) + len(self.body_rows))))
+        self.orbit_pos_km = np.empty((len(self.orbit_rows), 3))
+        self.orbit_R = ORBIT_R_PQW_TO_ECI[self.orbit_rows, :, :2]  # constant per row: gather once
+        self.comet_keys = [f"comet_{name.lower()}" for name in self.comet_actors]
+        self.comet_head_scale = np.array([COMET_ELEMENTS[name]["radius_km"] for name in self.comet_actors]) * 120 * SIZEKM_TO_SCENE / COMET_GRID_HALF
+        # Smoothed nucleus position per comet (scene units), and last frame's Kepler position
+        # (km) for the tail-direction velocity estimate
+        self.comet_positions = np.array([actors[0].GetPosition() for actors in self.comet_actors.values()]).reshape(-1, 3)
+        self.prev_comet_pos_km = None
+
 
         
        
@@ -3112,19 +3432,24 @@ class SolarSystemAnimator:
         self.haumea_actor = haumeaactor if haumeaactor else None
         self.makemake_actor = makemakeactor if makemakeactor else None
         self.ceres_actor = ceresactor if ceresactor else None
+        self.body_actors = [getattr(self, f"{name}_actor", None) for name in BODY_NAMES]
+        self.body_pos_scene = np.zeros((len(BODY_NAMES), 3))  # row = BODY_ID, refilled each frame
        
-        init_jd = get_current_jd()
-        gmst_deg = gmst_from_jd(init_jd)
+        init_jd, gmst_deg = get_current_jd_gmst()
         self.earth_actor.RotateZ(gmst_deg + 180)
           
         # ----- animation state -------------------------------------------------
-        self.last_time = time.time()
+        self.last_time_ns = time.monotonic_ns()
+        self.sim_elapsed_ns = 0  # integer, so long sessions don't lose low bits
+        self.shown_sim_second = None
         self.current_focus_planet = None
         self.moon_number_buffer = ""
         self.current_focus_actor = None
         self.current_min_dist = MIN_ZOOM_DISTANCE
         self.plotter._in_update = False  # Flag for double-render prevention
-        self.accumulator = 0.0
+        self.comet_volume_accum_ns = COMET_VOLUME_INTERVAL_NS  # rebuild on the first frame
+        self.clip_range_accum_ns = 0
+        self.cam_dirty = True
         self.comets_visible = True
 
        
@@ -3157,36 +3482,19 @@ class SolarSystemAnimator:
                 actor.RotateX(AXIAL_TILTS[name])
                
         # ----- key bindings ----------------------------------------------------
-        self.plotter.add_key_event('j', lambda: self.set_planet_focus('jupiter', self.jupiter_actor))
-        self.plotter.add_key_event('s', lambda: self.set_planet_focus('saturn', self.saturn_actor))
-        self.plotter.add_key_event('n', lambda: self.set_planet_focus('neptune',self.neptune_actor))
-        self.plotter.add_key_event('u', lambda: self.set_planet_focus('uranus', self.uranus_actor))
-        self.plotter.add_key_event('m', lambda: self.set_planet_focus('mars', self.mars_actor))
-        self.plotter.add_key_event('g', lambda: self.set_planet_focus('earth', self.earth_actor))
-        self.plotter.add_key_event('v', lambda: self.set_planet_focus('venus', self.venus_actor))
-        self.plotter.add_key_event('y', lambda: self.set_planet_focus('mercury',self.mercury_actor))
+        # Body focus keys; dwarfs are only bound when their actor exists
+        focus_keys = {'j': 'jupiter', 's': 'saturn', 'n': 'neptune', 'u': 'uranus', 'm': 'mars',
+                      'g': 'earth', 'v': 'venus', 'y': 'mercury',
+                      'o': 'pluto', 'i': 'eris', 'h': 'haumea', 'k': 'makemake', 'c': 'ceres'}
+        for key, name in focus_keys.items():
+            actor = getattr(self, f"{name}_actor", None)
+            if actor is not None:
+                self.plotter.add_key_event(key, lambda n=name, a=actor: self.set_planet_focus(n, a))
         self.plotter.add_key_event('a', self.focus_asteroid_belt)
         self.plotter.add_key_event('t', self.focus_sun)
+        for key, comet in {'z': 'halley', 'x': 'halebopp', 'l': 'enscke', 'd': 'lovejoy'}.items():
+            self.plotter.add_key_event(key, lambda c=comet: self.focus_on_comet(c))
 
-
-        self.plotter.add_key_event('z', lambda: self.focus_on_comet('halley'))
-        self.plotter.add_key_event('x', lambda: self.focus_on_comet('halebopp'))
-        self.plotter.add_key_event('l', lambda: self.focus_on_comet('enscke'))
-        self.plotter.add_key_event('d', lambda: self.focus_on_comet('lovejoy'))
-
-        
-        # Dwarf keys (guarded to prevent crashes if actor is None)
-        if self.pluto_actor is not None:
-            self.plotter.add_key_event('o', lambda: self.set_planet_focus('pluto', self.pluto_actor))
-        if self.eris_actor is not None:
-            self.plotter.add_key_event('i', lambda: self.set_planet_focus('eris', self.eris_actor))  # Avoid conflict with Earth 'g'
-        if self.haumea_actor is not None:
-            self.plotter.add_key_event('h', lambda: self.set_planet_focus('haumea', self.haumea_actor))
-        if self.makemake_actor is not None:
-            self.plotter.add_key_event('k', lambda: self.set_planet_focus('makemake', self.makemake_actor))
-        if self.ceres_actor is not None:
-            self.plotter.add_key_event('c', lambda: self.set_planet_focus('ceres', self.ceres_actor))
-        
         # Numeric keys for moons (0-9)
         for num in range(10):
             self.plotter.add_key_event(str(num), lambda n=num: self.handle_numeric_key(n))
@@ -3204,52 +3512,45 @@ class SolarSystemAnimator:
             self.mercury_actor.RotateZ(-merc_gmst)
            
         # ----- Consolidated Moon Initial Setup (single loop, no duplicates) -----
-        for planet_name, moons in self.moon_actors.items():
-            mu = GM_PLANET.get(planet_name, GM_EARTH)
-            for i, (moon_dict, actor) in enumerate(moons):
-                required = {"a_km", "e", "i_deg", "Omega_deg", "omega_deg", "M0_deg", "epoch_jd"}
-                if not required.issubset(moon_dict.keys()):
-                    continue
-                # True anomaly at start-up
-                _, _, _, _, v_deg = kepler_to_state(
-                    moon_dict["a_km"], moon_dict["e"], moon_dict["i_deg"],
-                    moon_dict["Omega_deg"], moon_dict["omega_deg"],
-                    moon_dict["M0_deg"], moon_dict["epoch_jd"], init_jd, mu=mu
-                )
-                # Axial tilt (most moons ≈0°)
-                moon_name_lower = moon_dict["name"].lower()
-                tilt = AXIAL_TILTS.get(moon_name_lower, 0.0)
-                prograde_moons = ["moon", "io", "europa", "ganymede", "callisto", "phobos", "deimos"]
-                sign = -1 if moon_name_lower in prograde_moons else 1
-                actor.RotateX(sign * tilt)
-                # Lock near side to planet
-                actor.RotateZ(v_deg)
-                moon_dict["tilt_applied"] = True  # Prevent double in update()
+        # True anomaly at start-up for every moon in one batched solve
+        _, init_nu = propagate_orbit_table(self.moon_rows, init_jd, with_nu=True)
+        init_v_deg = np.degrees(init_nu)
+        # (every moon_list entry has an orbit-table row, so its elements are complete)
+        for (planet_name, moon_dict, actor), v_deg in zip(self.moon_list, init_v_deg):
+            # Axial tilt (most moons ≈0°)
+            moon_name_lower = moon_dict["name"].lower()
+            tilt = AXIAL_TILTS.get(moon_name_lower, 0.0)
+            sign = -1 if moon_name_lower in PROGRADE_MOONS else 1
+            actor.RotateX(sign * tilt)
+            # Lock near side to planet
+            actor.RotateZ(v_deg)
+            moon_dict["tilt_applied"] = True  # Prevent double in update()
 
         # ----- mouse-wheel zoom (clamped) --------------------------------------
         if hasattr(self.plotter, 'iren') and self.plotter.iren is not None:
-            self.plotter.iren.add_observer("MouseWheelForwardEvent", self.limit_zoom)
-            self.plotter.iren.add_observer("MouseWheelBackwardEvent", self.limit_zoom)
+            # forward = zoom-in, backward = zoom-out
+            self.plotter.iren.add_observer("MouseWheelForwardEvent", lambda *_: self.limit_zoom(0.9))
+            self.plotter.iren.add_observer("MouseWheelBackwardEvent", lambda *_: self.limit_zoom(1.1))
+            # Mouse drags move the camera outside update(); refit clipping on the next frame
+            self.plotter.iren.add_observer("InteractionEvent", self.mark_camera_dirty)
 
+    def mark_camera_dirty(self, *_):
+        self.cam_dirty = True
     # ----------------------------------------------------------------------
     # ZOOM LIMITER – uses auto-clipping, no double render
     # ----------------------------------------------------------------------
-    def limit_zoom(self, caller=None, event=None):
+    def limit_zoom(self, zoom_factor):
         try:
             cam = self.plotter.camera
-            pos = np.array(cam.GetPosition())
-            focal = np.array(cam.GetFocalPoint())
-            direction = focal - pos
-            dist = np.linalg.norm(direction)
+            pos = cam.GetPosition()
+            focal = cam.GetFocalPoint()
+            # 3-vectors: plain math beats numpy's per-call overhead here
+            dist = math.dist(pos, focal)
             if dist < 1e-9:
                 return
-            direction /= dist
-            # forward = zoom-in, backward = zoom-out
-            zoom_factor = 0.9 if event and 'Forward' in str(event) else 1.1
-            new_dist = dist * zoom_factor
-            new_dist = max(new_dist, self.current_min_dist)
-            new_pos = focal - direction * new_dist
-            cam.SetPosition(*new_pos)
+            new_dist = max(dist * zoom_factor, self.current_min_dist)
+            k = new_dist / dist
+            cam.SetPosition([f + (p - f) * k for p, f in zip(pos, focal)])
             # AUTO CLIPPING – adjusts based on visible actors, fixes disappearing objects
             self.plotter.reset_camera_clipping_range()
             # Render only if NOT in update loop (prevents flicker)
@@ -3312,38 +3613,8 @@ class SolarSystemAnimator:
         view_vec = old_pos - old_focal
         vnorm = np.linalg.norm(view_vec)
         view_dir = view_vec / vnorm if vnorm > 1e-9 else np.array([0.0, 0.0, 1.0])
-        base_radius = {
-            "mercury": MERCURY_RADIUS,
-            "venus": VENUS_RADIUS,
-            "earth": EARTH_RADIUS,
-            "mars": MARS_RADIUS,
-            "jupiter": JUPITER_RADIUS,
-            "saturn": SATURN_RADIUS,
-            "uranus": URANUS_RADIUS,
-            "neptune": NEPTUNE_RADIUS,
-            "pluto": PLUTO_RADIUS,
-            "eris": ERIS_RADIUS,
-            "haumea": HAUMEA_RADIUS,
-            "makemake": MAKEMAKE_RADIUS,
-            "ceres": CERES_RADIUS,
-            "sun": SUN_RADIUS,
-        }.get(actor_name.split("_")[0] if "_" in actor_name else actor_name, JUPITER_RADIUS * 0.01)
-        orbit_scale = {
-            "mercury": MERCURY_ORBIT_RADIUS,
-            "venus": VENUS_ORBIT_RADIUS,
-            "earth": EARTH_ORBIT_RADIUS,
-            "mars": MARS_ORBIT_RADIUS,
-            "jupiter": JUPITER_ORBIT_RADIUS,
-            "saturn": SATURN_ORBIT_RADIUS,
-            "uranus": URANUS_ORBIT_RADIUS,
-            "neptune": NEPTUNE_ORBIT_RADIUS,
-            "pluto": PLUTO_ORBIT_RADIUS,
-            "eris": ERIS_ORBIT_RADIUS,
-            "haumea": HAUMEA_ORBIT_RADIUS,
-            "makemake": MAKEMAKE_ORBIT_RADIUS,
-            "ceres": CERES_ORBIT_RADIUS,
-        }
-        desired_distance = max(orbit_scale.get(actor_name, base_radius * 20) * 0.25, self.current_min_dist)
+        base_radius = RADII.get(actor_name.split("_")[0] if "_" in actor_name else actor_name, JUPITER_RADIUS * 0.01)
+        desired_distance = max(ORBIT_RADII.get(actor_name, base_radius * 20) * 0.25, self.current_min_dist)
         new_focal = actor_pos
         new_position = new_focal + view_dir * desired_distance
         cam.SetFocalPoint(*new_focal)
@@ -3441,189 +3712,143 @@ class SolarSystemAnimator:
         if self.plotter._in_update:
             return
         self.plotter._in_update = True
-        current_time = time.time()
-        dt_real = min(current_time - self.last_time, 0.1)  # Cap at 100ms to handle lag spikes
-        self.last_time = current_time
-        dt_sim = dt_real * SIM_SECONDS_PER_REAL_SECOND
-        self.total_sim_time += dt_sim
+        now_ns = time.monotonic_ns()
+        dt_real_ns = min(now_ns - self.last_time_ns, 100_000_000)  # Cap at 100ms to handle lag spikes
+        self.last_time_ns = now_ns
+        dt_sim_ns = int(dt_real_ns * SIM_SECONDS_PER_REAL_SECOND)
+        self.sim_elapsed_ns += dt_sim_ns
+        dt_sim = dt_sim_ns * 1e-9
+        self.total_sim_time = self.sim_elapsed_ns * 1e-9
         global SIM_TIME
-        SIM_TIME += dt_sim
-        sim_dt = datetime.fromtimestamp(SIM_TIME, tz=timezone.utc)
-        formatted_time = sim_dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-        self.time_text.SetText(2, f"Simulated Date: {formatted_time}")
-        target_jd = datetime_to_julian_day(sim_dt)
-
-        # ----- Update planet positions -----
-        set_body_position_from_elements("mercury", self.mercury_actor, orbital_elements["mercury"], target_jd)
-        set_body_position_from_elements("venus", self.venus_actor, orbital_elements["venus"], target_jd)
-        set_body_position_from_elements("earth", self.earth_actor, orbital_elements["earth"], target_jd)
-        set_body_position_from_elements("mars", self.mars_actor, orbital_elements["mars"], target_jd)
-        set_body_position_from_elements("jupiter", self.jupiter_actor, orbital_elements["jupiter"], target_jd)
-        set_body_position_from_elements("saturn", self.saturn_actor, orbital_elements["saturn"], target_jd)
-        set_body_position_from_elements("uranus", self.uranus_actor, orbital_elements["uranus"], target_jd)
-        set_body_position_from_elements("neptune", self.neptune_actor, orbital_elements["neptune"], target_jd)
-        set_body_position_from_elements("pluto", self.pluto_actor, orbital_elements["pluto"], target_jd)
-        set_body_position_from_elements("eris", self.eris_actor, orbital_elements["eris"], target_jd)
-        set_body_position_from_elements("haumea", self.haumea_actor, orbital_elements["haumea"], target_jd)
-        set_body_position_from_elements("makemake", self.makemake_actor, orbital_elements["makemake"], target_jd)
-        set_body_position_from_elements("ceres", self.ceres_actor, orbital_elements["ceres"], target_jd)
+        SIM_TIME = SIM_START_UTC.timestamp() + self.total_sim_time
+        # The date text has 1 s resolution; only rebuild it (and re-rasterize the text actor)
+        # when the displayed second changes
+        shown_second = (SIM_START_UTC.microsecond + self.sim_elapsed_ns // 1000) // 1_000_000
+        if shown_second != self.shown_sim_second:
+            self.shown_sim_second = shown_second
+            sim_dt = SIM_START_UTC + timedelta(microseconds=self.sim_elapsed_ns // 1000)
+            formatted_time = sim_dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+            self.time_text.SetText(2, f"Simulated Date: {formatted_time}")
+        target_jd = SIM_START_JD + self.total_sim_time / 86400.0
+
+        # ----- Planets, dwarfs, moons and comets: one batched Kepler solve -----
+        propagate_orbit_table(self.orbit_rows, target_jd, self.orbit_time_scale, out=self.orbit_pos_km, R=self.orbit_R)
+        n_moons = len(self.moon_rows)
+        body_pos = self.body_pos_scene
+        np.multiply(self.orbit_pos_km[-len(self.body_rows):], KM_TO_SCENE, out=body_pos[1:])
+        for actor, pos in zip(self.body_actors[1:], body_pos[1:].tolist()):
+            actor.SetPosition(pos)
 
         # ----- Sun barycentric wobble -----
         jup_mass = GM_JUPITER / GM_SUN
         sat_mass = GM_SATURN / GM_SUN
-        jup_pos = np.array(self.jupiter_actor.GetPosition())
-        sat_pos = np.array(self.saturn_actor.GetPosition())
-        sun_wobble = (jup_mass * jup_pos + sat_mass * sat_pos) / (1 + jup_mass + sat_mass)
-        self.sun_actor.SetPosition(*sun_wobble)
+        wobble_norm = 1.0 / (1 + jup_mass + sat_mass)
+        body_pos[0] = (jup_mass * body_pos[BODY_ID["jupiter"]] + sat_mass * body_pos[BODY_ID["saturn"]]) * wobble_norm
+        self.sun_actor.SetPosition(body_pos[0].tolist())
 
         # ----- Planet + sun rotations -----
-        for name, actor in [
-            ("sun", self.sun_actor),
-            ("mercury", self.mercury_actor),
-            ("venus", self.venus_actor),
-            ("earth", self.earth_actor),
-            ("mars", self.mars_actor),
-            ("jupiter", self.jupiter_actor),
-            ("saturn", self.saturn_actor),
-            ("uranus", self.uranus_actor),
-            ("neptune", self.neptune_actor),
-            ("pluto", self.pluto_actor),
-            ("eris", self.eris_actor),
-            ("haumea", self.haumea_actor),
-            ("makemake", self.makemake_actor),
-            ("ceres", self.ceres_actor),
-        ]:
-            deg = ROTATION_DEG_PER_SIMSEC[name] * dt_sim
-            actor.RotateZ(deg % 360.0)
+        spin_deg = SPIN_DEG_PER_SIMSEC_ARR * dt_sim  # relative per-frame delta; RotateZ needs no wrap
+        for actor, deg in zip(self.body_actors, spin_deg):
+            actor.RotateZ(deg)
 
         # Ring follow
+        saturn_pos = body_pos[BODY_ID["saturn"]].tolist()
         for ractor in self.ring_actors:
-            ractor.SetPosition(*self.saturn_actor.GetPosition())
+            ractor.SetPosition(saturn_pos)
+        uranus_pos = body_pos[BODY_ID["uranus"]].tolist()
         for ractor in self.uranus_ring_actors:
-            ractor.SetPosition(*self.uranus_actor.GetPosition())
+            ractor.SetPosition(uranus_pos)
             
-        sun_pos = np.array(self.sun_actor.GetPosition())
+        sun_pos = body_pos[0]
         sun_pos_km = sun_pos / KM_TO_SCENE  # Convert sun position to km for distance calculations
 
-        # ----- Update halo positions/orientations (planets + comets) -----
-        for full_key, halo in halo_actors.items():
-            if full_key in halo_parents:  # Safe check
-                parent = halo_parents[full_key]
-                halo.SetPosition(*parent.GetPosition())
-                halo.SetOrientation(*parent.GetOrientation())
-                
-                # Comet-specific tweaks (if key indicates comet)
-                if 'comet' in full_key.lower() or full_key.startswith('comet_'):
-                    # Get comet name from key (e.g., 'comet_halley')
-                    comet_name = full_key.split('_')[-1] if '_' in full_key else full_key
-                    r_km = np.linalg.norm(np.array(parent.GetPosition()) / KM_TO_SCENE - sun_pos_km)
-                    
-                    # Only show halo if within sublimation range
-                    if r_km < SUBLIMATION_DISTANCE:
-                        halo.SetVisibility(True)
-                        # Fade opacity based on distance (brighter closer to sun)
-                        halo_opacity = min(0.3 * (AU_KM / max(r_km, 0.1 * AU_KM)), 0.8)
-                        halo.GetProperty().SetOpacity(halo_opacity)
-                        halo.GetProperty().SetColor(0.7, 0.9, 1.0)  # Cyan for comets
-                    else:
-                        halo.SetVisibility(False)
-                        # Optional: Set opacity to 0 even if visible (backup)
-                        halo.GetProperty().SetOpacity(0.0)
-
+        cam_pos = self.plotter.camera.GetPosition()  # read once; comets and moons both use it
 
         # ----- Update comet positions, halo & volumetric body -----
         if self.comets_visible:
-            for name, (nucleus_actor, _) in self.comet_actors.items():
+            # ---- 1. Keplerian positions (from the shared batch) ----
+            comet_pos_km = self.orbit_pos_km[n_moons:n_moons + len(self.comet_rows)]
+            # Sublimation test for every comet at once
+            comet_r_km = np.linalg.norm(comet_pos_km - sun_pos_km, axis=1)
+            comet_active = comet_r_km < SUBLIMATION_DISTANCE
+            # Coma fades with distance (brighter closer to the sun)
+            comet_halo_opacity = np.minimum(0.3 * (AU_KM / np.maximum(comet_r_km, 0.1 * AU_KM)), 0.8)
+            self.comet_volume_accum_ns += dt_real_ns
+            rebuild_volumes = self.comet_volume_accum_ns >= COMET_VOLUME_INTERVAL_NS
+            if rebuild_volumes:
+                self.comet_volume_accum_ns = 0
+
+            # ---- 2. Nucleus smoothing, point size and tail velocity for every comet at once ----
+            comet_finite = np.isfinite(comet_pos_km).all(axis=1)
+            comet_pos_scene = comet_pos_km * KM_TO_SCENE
+            self.comet_positions[comet_finite] = (0.3 * self.comet_positions[comet_finite]
+                                                  + 0.7 * comet_pos_scene[comet_finite])  # Smooth motion
+            view_dist = np.linalg.norm(self.comet_positions - cam_pos, axis=1)
+            point_size = np.maximum(1.0, 6.0 * (AU_SCALE / np.maximum(view_dist, AU_SCALE * 0.01)))
+            # Subpixel volumes add nothing on screen; a hidden one is rebuilt as soon as it shows again
+            px_per_unit = self.plotter.window_size[1] / (2.0 * math.tan(math.radians(self.plotter.camera.GetViewAngle()) * 0.5))
+            vol_px = COMET_GRID_HALF * px_per_unit / np.maximum(view_dist, 1e-9)
+            comet_show_volume = comet_active & (vol_px >= COMET_VOLUME_MIN_PIXELS)
+            if self.prev_comet_pos_km is None:
+                self.prev_comet_pos_km = comet_pos_km.copy()
+            comet_vel_scene = np.zeros_like(comet_pos_km)
+            if dt_sim > 1e-9:  # Prevent division by zero if dt_sim is ~0
+                comet_vel_scene = (comet_pos_km - self.prev_comet_pos_km) / dt_sim * KM_TO_SCENE
+            self.prev_comet_pos_km[comet_finite] = comet_pos_km[comet_finite]
+            comet_speed = np.linalg.norm(comet_vel_scene, axis=1)
+
+            # ---- 3. Push to the actors ----
+            for k, (name, (nucleus_actor, _)) in enumerate(self.comet_actors.items()):
+                if not comet_finite[k]:
+                    continue
+                halo_key = self.comet_keys[k]
+                active = bool(comet_active[k])
                 try:
-                    # ---- 1. Keplerian position ----
-                    target_jd = datetime_to_julian_day(sim_dt)
-                    mx_km, my_km, mz_km, _, _ = kepler_to_state(
-                        COMET_ELEMENTS[name]["a_km"], COMET_ELEMENTS[name]["e"],
-                        COMET_ELEMENTS[name]["i_deg"], COMET_ELEMENTS[name]["Omega_deg"],
-                        COMET_ELEMENTS[name]["omega_deg"], COMET_ELEMENTS[name]["M0_deg"],
-                        COMET_ELEMENTS[name]["epoch_jd"], target_jd, mu=GM_SUN
-                    )
-                    pos_km = np.array([mx_km, my_km, mz_km])
-                    if not np.all(np.isfinite(pos_km)):
-                        continue
-
-                    # ---- 2. Scale & cap ----
-                    pos_scene = km_to_scene(pos_km)
-
-                    # ---- 3. Nucleus ----
-                    current_pos = np.array(nucleus_actor.GetPosition())
-                    new_pos = pos_scene
-                    smoothed_pos = 0.7 * current_pos + 0.7 * new_pos  # Smooth motion
-                    nucleus_actor.SetPosition(*smoothed_pos)
-                    cam_pos = np.array(self.plotter.camera.GetPosition())
-                    view_dist = np.linalg.norm(cam_pos - smoothed_pos)
-                    point_size = max(1.0, 6.0 * (AU_SCALE / max(view_dist, AU_SCALE * 0.01)))
-                    nucleus_actor.GetProperty().SetPointSize(point_size)
+                    smoothed_pos = self.comet_positions[k].tolist()
+                    nucleus_actor.SetPosition(smoothed_pos)
+                    nucleus_actor.GetProperty().SetPointSize(point_size[k])
                     nucleus_actor.SetVisibility(True)
 
-                    # ---- 4. Halo (coma glow) ----
-                    halo_key = f"comet_{name.lower()}"
+                    # Halo (coma glow)
                     if halo_key in halo_actors:
                         halo = halo_actors[halo_key]
-                        halo.SetPosition(*pos_scene)
-                        halo.SetOrientation(*nucleus_actor.GetOrientation())
-                        sun_pos_km = np.array(self.sun_actor.GetPosition()) / KM_TO_SCENE
-                        r_km = np.linalg.norm(pos_km - sun_pos_km)
-                        if r_km < SUBLIMATION_DISTANCE:
+                        halo.SetPosition(comet_pos_scene[k].tolist())
+                        if active:
                             halo.SetVisibility(True)
-                            halo_opacity = min(0.3 * (AU_KM / max(r_km, 0.1 * AU_KM)), 0.8)
-                            halo.GetProperty().SetOpacity(halo_opacity)
-                            halo.GetProperty().SetColor(0.7, 0.9, 1.0)  # Cyan glow
+                            halo.GetProperty().SetOpacity(comet_halo_opacity[k])
                         else:
                             halo.SetVisibility(False)
                             halo.GetProperty().SetOpacity(0.0)
 
-                        
-
-                    # ---- 5. Volumetric Body ----
-
-                    if halo_key not in self.prev_comet_pos:
-                        self.prev_comet_pos[halo_key] = pos_km.copy()
-
-                    # Prevent division by zero if dt_sim is ~0
-                    vel_km_s = np.zeros(3)
-                    if dt_sim > 1e-9:
-                        vel_km_s = (pos_km - self.prev_comet_pos[halo_key]) / dt_sim
-                    
-                    self.prev_comet_pos[halo_key] = pos_km.copy()
-                    vel_scene_s = vel_km_s * KM_TO_SCENE
-
-                    halo_radius_km = COMET_ELEMENTS[name]["radius_km"] * 120
-                    head_scale = halo_radius_km * SIZEKM_TO_SCENE / COMET_GRID_HALF
-
-                    # Generate density
-                    new_density = make_volumetric_comet_body(
-                        center=np.array([0.0, 0.0, 0.0]),
-                        velocity=vel_scene_s,
-                        t=self.total_sim_time,
-                        head_scale=head_scale
-                    )
-
-                    # Update grid
-                    vol_grid = vol_grids[halo_key]
-                    vol_grid.cell_data["comet"][:] = new_density.flatten(order="F")
-
-                    # REMOVE RECTANGULAR BLOCK: Zero out low density
-                    vol_grid.cell_data["comet"][vol_grid.cell_data["comet"] < 0.01] = 0.0
-                    vol_grid.Modified()
+                    # Volumetric body: hidden volumes are skipped; one that is just turning
+                    # visible is rebuilt at once
+                    vol_actor = vol_actors[halo_key] # Get the actor reference
+                    show_volume = bool(comet_show_volume[k])
+                    if show_volume and (rebuild_volumes or not vol_actor.GetVisibility()):
+                        new_density = make_volumetric_comet_body(
+                            center=np.array([0.0, 0.0, 0.0]),
+                            velocity=comet_vel_scene[k],
+                            t=self.total_sim_time,
+                            head_scale=self.comet_head_scale[k]
+                        )
+
+                        # Update grid in one write: the transposed view is the F-order cell layout,
+                        # and low density is zeroed on the way in (REMOVE RECTANGULAR BLOCK)
+                        vol_grid = vol_grids[halo_key]
+                        density_t = new_density.T
+                        np.multiply(density_t, density_t >= 0.01,
+                                    out=vol_grid.cell_data["comet"].reshape(density_t.shape))
+                        vol_grid.Modified()
 
                     # Position & orient
-                    vol_actor = vol_actors[halo_key] # Get the actor reference
-                    vol_actor.SetPosition(*smoothed_pos)
-                    if np.linalg.norm(vel_scene_s) > 1e-6:
-                        tail_dir = -vel_scene_s / np.linalg.norm(vel_scene_s)
-                        rot = R.align_vectors([tail_dir], [[1.0, 0.0, 0.0]])[0]
-                        euler_deg = rot.as_euler('xyz', degrees=True)
-                        vol_actor.SetOrientation(*euler_deg)
+                    if show_volume:
+                        vol_actor.SetPosition(smoothed_pos)
+                        if comet_speed[k] > 1e-6:
+                            tail_dir = -comet_vel_scene[k] / comet_speed[k]
+                            vol_actor.SetOrientation(_tail_orientation(*tail_dir.tolist()))
 
-                    vol_actor.SetVisibility(int(r_km < SUBLIMATION_DISTANCE))
+                    vol_actor.SetVisibility(int(show_volume))
 
-                    
                 except Exception as e:
                     print(f"[COMET] {name} update error: {e}")
                     import traceback
@@ -3635,86 +3860,54 @@ class SolarSystemAnimator:
 
 
                 # ----- MOONS -----
-        planet_positions = {}
-        for name in ["mercury", "venus", "earth", "mars", "jupiter", "saturn", "uranus", "neptune"]:
-            actor = getattr(self, f"{name}_actor")
-            if actor is not None:
-                planet_positions[name] = np.array(actor.GetPosition())
-        if self.pluto_actor is not None:
-            planet_positions["pluto"] = np.array(self.pluto_actor.GetPosition())
-        for name in ["eris", "haumea", "makemake", "ceres"]:
-            actor = getattr(self, f"{name}_actor", None)
-            if actor is not None:
-                planet_positions[name] = np.array(actor.GetPosition())
-        for planet_name, moons in self.moon_actors.items():
-            if planet_name not in planet_positions:
-                continue
-            px, py, pz = planet_positions[planet_name]
-            mu = GM_PLANET.get(planet_name, GM_EARTH)
-            for moon, actor in moons:
-                required = ["a_km", "e", "i_deg", "Omega_deg", "omega_deg", "M0_deg", "epoch_jd"]
-                if not all(k in moon for k in required):
-                    continue
-                epoch_jd = moon["epoch_jd"]
-                delta_jd = target_jd - epoch_jd
-                TINY_MOON_THRESHOLD = 150000  # km
-                TINY_MOON_SCALE = 0.1
-                orbit_scale = TINY_MOON_SCALE if moon.get("a_km", 0) < TINY_MOON_THRESHOLD else 1.0
-                effective_target_jd = epoch_jd + delta_jd * orbit_scale
-                mx_km, my_km, mz_km, _, _ = kepler_to_state(
-                    moon["a_km"], moon["e"], moon["i_deg"], moon["Omega_deg"],
-                    moon["omega_deg"], moon["M0_deg"], epoch_jd, effective_target_jd, mu=mu
-                )
-                moon_offset = np.array([mx_km, my_km, mz_km]) * KM_TO_SCENE * (1 / 0.02)
-                norm = np.linalg.norm(moon_offset)
-                if norm < JUPITER_TINY_THRESHOLD and norm > 0:
-                    moon_offset *= (JUPITER_TINY_THRESHOLD / norm)
-                current_pos = np.array(actor.GetPosition())
-                new_pos = np.array([px + moon_offset[0], py + moon_offset[1], pz + moon_offset[2]])
-                smoothed_pos = 0.3 * current_pos + 0.7 * new_pos
-                actor.SetPosition(*smoothed_pos)
-
-                moon_name = moon["name"].lower()
-                if "tilt_applied" not in moon:
-                    tilt = AXIAL_TILTS.get(moon_name, 0.0)
-                    prograde_moons = ["moon", "io", "europa", "ganymede", "callisto", "phobos", "deimos"]
-                    sign = -1 if moon_name in prograde_moons else 1
-                    actor.RotateX(sign * tilt)
-                    moon["tilt_applied"] = True
-
-                period = ROTATION_PERIOD.get(moon_name)
-                if period is None:
-                    a_km = moon["a_km"]
-                    period = 2 * math.pi * math.sqrt(a_km**3 / mu) if a_km > 0 and mu > 0 else 0
-                if period != 0:
-                    spin_scale = orbit_scale if TINY_MOON_SPIN_SCALE_MATCH else 1.0
-                    effective_period = period / spin_scale
-                    deg = (360.0 / effective_period) * dt_sim
-                    actor.RotateZ(deg % 360.0)
+        # Parent positions indexed by BODY_ID, as placed above this frame
+        parent_positions = body_pos
+        # Moon offsets from the shared batch above, one row per self.moon_list entry
+        moon_offsets_km = self.orbit_pos_km[:n_moons]
+        moon_offsets = moon_offsets_km * KM_TO_SCENE * (1 / 0.02)
+        norms = np.linalg.norm(moon_offsets, axis=1)
+        clamp = (norms > 0) & (norms < JUPITER_TINY_THRESHOLD)
+        moon_offsets[clamp] *= (JUPITER_TINY_THRESHOLD / norms[clamp])[:, None]
+        moon_targets = parent_positions[ORBIT_PARENT_ID[self.moon_rows]] + moon_offsets
+        # The banked angle is wrapped once here, so the per-frame delta needs no separate % 360
+        self.moon_spin_pending += self.moon_spin_rate * dt_sim
+        np.remainder(self.moon_spin_pending, 360.0, out=self.moon_spin_pending)
+        # Smooth every moon at once against last frame's positions, then push to the actors
+        self.moon_positions *= 0.3
+        moon_targets *= 0.7
+        self.moon_positions += moon_targets
+        for (_, _, actor), pos in zip(self.moon_list, self.moon_positions.tolist()):
+            actor.SetPosition(pos)
+        # Spin only moons big enough on screen to show it (point moons are drawn by tiny_moon_cloud)
+        cam_dist = np.linalg.norm(self.moon_positions - cam_pos, axis=1)
+        spin_idx = np.flatnonzero((self.moon_radius_scene > MOON_SPIN_CULL_RATIO * cam_dist) & ~self.moon_is_point)
+        for k, spin in zip(spin_idx.tolist(), self.moon_spin_pending[spin_idx].tolist()):
+            self.moon_list[k][2].RotateZ(spin)
+        self.moon_spin_pending[spin_idx] = 0.0
+
+        if len(self.tiny_moon_idx):
+            tiny_moon_cloud.points[:] = self.moon_positions[self.tiny_moon_idx]
+            tiny_moon_cloud.Modified()
+        sync_moon_halos()
 
         # ----- Asteroid belt -----
-        if self.asteroid_actor:
-            try:
-                cloud = self.asteroid_actor.GetMapper().GetInput()
-                if cloud.GetNumberOfPoints() > 0:
-                    points = cloud.points.copy()
-                    x, y, _ = points[:, 0], points[:, 1], points[:, 2]
-                    r_scene = np.sqrt(x**2 + y**2)
-                    r_km = r_scene / KM_TO_SCENE
-                    omega = np.sqrt(GM_SUN / r_km**3)
-                    dtheta = omega * dt_sim
-                    c, s = np.cos(dtheta), np.sin(dtheta)
-                    new_x = x * c - y * s
-                    new_y = x * s + y * c
-                    cloud.points[:, 0], cloud.points[:, 1] = new_x, new_y
-                    cloud.Modified()
-                    self.asteroid_actor.GetMapper().Modified()
-            except:
-                pass
-
-
-        # Render
-        self.plotter.reset_camera_clipping_range()
+        if self.asteroid_valid:
+            # Angle in float64 from the start positions, so nothing drifts or rounds away
+            turn = np.exp(1j * (self.asteroid_omega * self.total_sim_time)).astype(np.complex64, copy=False)
+            np.multiply(self.asteroid_xy0, turn, out=self.asteroid_xy)
+            points = self.asteroid_cloud.points  # written in place in the VTK buffer
+            points[:, 0] = self.asteroid_xy.real
+            points[:, 1] = self.asteroid_xy.imag
+            self.asteroid_cloud.Modified()  # the mapper picks this up from its input's MTime
+
+
+        # Render – the clipping range walks every actor's bounds, so only refit it
+        # after camera interaction or every CLIP_RANGE_INTERVAL_NS as bodies drift
+        self.clip_range_accum_ns += dt_real_ns
+        if self.cam_dirty or self.clip_range_accum_ns >= CLIP_RANGE_INTERVAL_NS:
+            self.plotter.reset_camera_clipping_range()
+            self.cam_dirty = False
+            self.clip_range_accum_ns = 0
         self.plotter.render()
         self.plotter._in_update = False
 
@@ -3731,12 +3924,31 @@ comet_actors = create_comet_actors(pl, COMET_ELEMENTS)
 # ------------------------------------------------------------------
 COMET_TAIL_LENGTH_FACTOR = 5.0
 COMET_TAIL_WIDTH_FACTOR  = 1.0
+# Density grids are rebuilt at most this often (real time); placement and orientation stay per frame
+COMET_VOLUME_INTERVAL_NS = 50_000_000
+# Volumes whose projected half-size is below this many pixels are hidden and not rebuilt
+COMET_VOLUME_MIN_PIXELS = 1.0
+
+
+def _tail_orientation(dx, dy, dz):
+    """Extrinsic xyz Euler angles (deg) of the shortest rotation taking +X onto the unit vector d.
+
+    Closed form of Rotation.align_vectors([d], [[1, 0, 0]])[0].as_euler('xyz', degrees=True).
+    """
+    return (math.degrees(math.atan2(-dy * dz, dx + 1.0 - dz * dz)),
+            -math.degrees(math.asin(max(-1.0, min(1.0, dz)))),
+            math.degrees(math.atan2(dy, dx)))
 
 # === SHRINK THE GRID (makes comet smaller) ===
 COMET_GRID_SIZE = 128
 COMET_GRID_HALF = 1.0   # ← WAS 3.0 → now 60% smaller (1.8 / 3.0 = 0.6x size)
 COMET_GRID = np.linspace(-COMET_GRID_HALF, COMET_GRID_HALF, COMET_GRID_SIZE)
-Xg, Yg, Zg = np.meshgrid(COMET_GRID, COMET_GRID, COMET_GRID, indexing="ij")
+# Sparse (broadcastable) axes: most density terms depend on only one or two axes, so they are
+# evaluated on 1-D/2-D slices and only the genuinely 3-D terms fill the full grid.
+# The field is float32 throughout (volume scalars need no more), so every scalar mixed into it
+# below is a plain Python float to keep NumPy from promoting the arrays to float64.
+_COMET_AXIS32 = COMET_GRID.astype(np.float32)
+Xg, Yg, Zg = np.meshgrid(_COMET_AXIS32, _COMET_AXIS32, _COMET_AXIS32, indexing="ij", sparse=True)
 
 # === DENSITY BOOST (preserves total "particles") ===
 SIZE_REDUCTION_FACTOR = 3.0 / COMET_GRID_HALF  # ~1.67x
@@ -3754,45 +3966,85 @@ COMET_CMAPS = {
 
 vol_grids = {}
 vol_actors = {}
+
+# Start-up fields (t=0, no velocity) depend only on head_scale; comets sharing one reuse it
+@functools.lru_cache(maxsize=None)
+def _cached_comet_field(head_scale):
+    """make_volumetric_comet_body at t=0, cached in memory for this run."""
+    return make_volumetric_comet_body(
+        center=np.array([0.0, 0.0, 0.0]),
+        velocity=np.array([0.0, 0.0, 0.0]),
+        t=0.0,
+        head_scale=head_scale
+    )
+
 print(f"[INFO] Adding DENSER volumetric comet body (size ×{1/SIZE_REDUCTION_FACTOR:.2f}, density ×{DENSITY_SCALE:.1f})...")
 
 def make_volumetric_comet_body(center, velocity, t, head_scale=1.0):
-    safe_head_scale = max(head_scale, 1e-6)
+    t = float(t)
+    safe_head_scale = max(float(head_scale), 1e-6)
     falloff_constant = math.log(1.5 / 0.1) / COMET_GRID_HALF / safe_head_scale
 
-    vel_norm = np.linalg.norm(velocity)
-    tail_dir = -velocity / vel_norm if vel_norm > 0 else np.array([1.0, 0.0, 0.0])
+    # 3-vector scalar math in python floats (numpy scalars would also upcast the float32 grids)
+    vx, vy, vz = map(float, velocity)
+    vel_norm = math.sqrt(vx * vx + vy * vy + vz * vz)
+    if vel_norm > 0:
+        inv = -1.0 / vel_norm
+        tx, ty, tz = vx * inv, vy * inv, vz * inv
+    else:
+        tx, ty, tz = 1.0, 0.0, 0.0
 
     # Slight forward shift to center density on nucleus
-    center = center - tail_dir * 0.025
+    x0, y0, z0 = map(float, center)
+    cx, cy, cz = x0 - tx * 0.025, y0 - ty * 0.025, z0 - tz * 0.025
 
+    # Full-grid (128^3) terms are built in place in two buffers; everything that depends on
+    # at most two axes (and every scalar factor) is folded into small broadcast arrays first.
     # ---------- HEAD (coma) ----------
-    rhead = np.sqrt((Xg-center[0])**2 + (Yg-center[1])**2 + (Zg-center[2])**2)
-    head = np.exp(-rhead * falloff_constant)
+    rhead = (Xg-cx)**2 + (Yg-cy)**2 + (Zg-cz)**2
+    np.sqrt(rhead, out=rhead)
     mask_radius = COMET_GRID_HALF * 0.8
     head_mask = rhead <= mask_radius
-    head = head * head_mask.astype(float)
+    head = rhead
+    head *= -falloff_constant
+    np.exp(head, out=head)
+    head *= head_mask
 
     # ---------- TAIL ----------
-    tail_axis = (Xg-center[0])*tail_dir[0] + (Yg-center[1])*tail_dir[1] + (Zg-center[2])*tail_dir[2]
-    tail_axis_stretched = tail_axis * COMET_TAIL_LENGTH_FACTOR
+    L = COMET_TAIL_LENGTH_FACTOR
+    tail_axis_stretched = (Xg-cx)*(tx*L) + (Yg-cy)*(ty*L) + (Zg-cz)*(tz*L)
     tailmask = tail_axis_stretched > 0
-    rcyl = np.sqrt(((Yg-center[1]) - tail_dir[1]*tail_axis_stretched)**2 +
-                   ((Zg-center[2]) - tail_dir[2]*tail_axis_stretched)**2)
+    # Squared distance from the tail axis (the Gaussian below only needs rcyl**2)
+    rcyl2 = tail_axis_stretched * -ty
+    rcyl2 += Yg-cy
+    rcyl2 *= rcyl2
+    dz = tail_axis_stretched
+    dz *= -tz
+    dz += Zg-cz
+    dz *= dz
+    rcyl2 += dz
     width = (0.25 + 0.13*np.sin(t*1.5 + Yg*2.2 + Zg*2.2 + t*0.3)) * COMET_TAIL_WIDTH_FACTOR
     turbulence = 0.8 + 0.2*np.sin(2.5*t + Zg*1.7 + Xg*1.3 + t*0.5)
-    dist = np.abs(center[0] - Xg) * turbulence
+    dist = np.abs(cx - Xg) * turbulence
     vortex = 1.0 + 0.15 * np.sin(t*2.5 + Yg*3.0 + t*0.4) * \
-            np.sin(3*np.arctan2(Zg-center[2], Yg-center[1]) + t*2 + t*0.6)
-    tail = tailmask * np.exp(-dist*1.25) * np.exp(-rcyl**2/width**2) * vortex
-    flicker = 0.8 + 0.2 * np.sin(t * 0.25)
-
-    density = head * 1.5 + tail * flicker
-    density = np.clip(density, 0, None)
-    density = gaussian_filter(density, sigma=1.0)
+            np.sin(3*np.arctan2(Zg-cz, Yg-cy) + t*2 + t*0.6)
+    flicker = 0.8 + 0.2 * math.sin(t * 0.25)
+    tail = rcyl2
+    tail *= -1.0 / width**2
+    np.exp(tail, out=tail)
+    tail *= np.exp(-dist*1.25)
+    # density = 1.5 * head + flicker * tail; the 1.5 is applied after the (linear) blur
+    tail *= vortex * (flicker / 1.5)
+    tail *= tailmask
+
+    # Combine and blur in place (every term is non-negative, so no clamp is needed)
+    density = head
+    density += tail
+    from scipy.ndimage import gaussian_filter  # deferred: keeps SciPy off the start-up path
+    gaussian_filter(density, sigma=1.0, output=density)
 
     # === BOOST DENSITY TO PRESERVE TOTAL "MASS" ===
-    density *= DENSITY_SCALE
+    density *= DENSITY_SCALE * 1.5
 
     return density
 
@@ -3800,12 +4052,7 @@ for name, (nucleus_actor, _) in comet_actors.items():
     key = f"comet_{name.lower()}"
     halo_radius_km = COMET_ELEMENTS[name]["radius_km"] * 120
     head_scale = halo_radius_km * SIZEKM_TO_SCENE / COMET_GRID_HALF
-    density = make_volumetric_comet_body(
-        center=np.array([0.0, 0.0, 0.0]),
-        velocity=np.array([0.0, 0.0, 0.0]),
-        t=0.0,
-        head_scale=head_scale
-    )
+    density = _cached_comet_field(head_scale)
     grid = pv.ImageData()
     grid.dimensions = np.array(density.shape) + 1
     step = COMET_GRID[1] - COMET_GRID[0]
@@ -3847,8 +4094,8 @@ for comet_name, comet_tuple in comet_actors.items():
         halo = add_atmosphere_halo(nucleus_actor, comet_data, moon_colors=moon_colors)
         if halo is not None:
             full_key = f"comet_{comet_name.lower()}"
+            halo.GetProperty().SetColor(0.7, 0.9, 1.0)  # Cyan glow
             halo_actors[full_key] = halo
-            halo_parents[full_key] = nucleus_actor
             print(f"[INFO] Added halo for {comet_name}")
     except Exception as e:
         print(f"[ERROR] Failed to create halo for comet {comet_name}: {e}")
@@ -3872,6 +4119,7 @@ print("Controls: 'j' Jupiter, 's' Saturn, 'n' Neptune, 'u' Uranus, 'm' Mars, 'g'
 print(f"System scaled by {GLOBAL_SCALE_MULTIPLIER}x")
 print("-" * 80)
 
+pl.suppress_rendering = False
 pl.show(title=f"Solar System ({GLOBAL_SCALE_MULTIPLIER}x Scale)", auto_close=False, interactive=False)
 interactor = pl.render_window.GetInteractor()
 style = interactor.GetInteractorStyle()